@@ -0,0 +1,114 @@
+import argparse
+
+import Feedback
+import SharedCache
+import Tournament
+import wss
+
+
+class AdversarialGame(wss.Game):
+    """A Wordle host that cheats, as much as it can get away with.
+
+    Rather than picking a solution up front, the host keeps every solution that
+    is still consistent with the feedback it has given so far. For each guess
+    it splits those candidates up by the feedback they'd produce and gives the
+    feedback that leaves the most of them in play, so the player always gets
+    the worst case. It only concedes a win when the guess is the last candidate
+    standing.
+
+    As far as the players can tell it's a normal Game: the solution attribute
+    always holds one of the remaining candidates (so isWon() works as usual),
+    it just isn't decided until the end.
+
+    Attributes:
+        candidates: The solutions still consistent with every round so far.
+        openingBuckets: Class-wide cache of how each opening guess partitions
+          the full solution list, keyed by the word index and the guess's id.
+          Every game starts from the same candidates, so the first (and by
+          far the biggest) partition for a guess only needs working out once.
+    """
+    openingBuckets = SharedCache.SharedCache()
+
+    def reset(self, soln=None):
+        """Prepares for a new game with every legal solution as a candidate.
+        The soln argument is accepted so this can be used anywhere a Game is,
+        but the adversary never commits to a solution in advance.
+        """
+        super().reset(soln)
+        self.candidates = self.soln_words
+        self.solution = self.candidates[0]
+
+    def matchWord(self, word):
+        """Gives the feedback for word that keeps the most solutions in play,
+        and narrows the candidates down to the ones consistent with it.
+        """
+        if self.candidates is self.soln_words:
+            # Every game shares these, so they're frozen as tuples.
+            buckets = self.openingBuckets.get(
+                (self.index, self.index.idOf(word)),
+                lambda: {code: tuple(bucket) for code, bucket in
+                         Feedback.partition(word, self.candidates).items()})
+        else:
+            buckets = Feedback.partition(word, self.candidates)
+
+        # Biggest bucket wins. On a tie, don't concede (the all green bucket
+        # only ever has the guess in it), then prefer the fewest green/yellow
+        # letters, just so that the choice is repeatable.
+        win = Feedback.allGreen(len(word))
+        code = max(buckets,
+                   key=lambda c: (len(buckets[c]), c != win, -c))
+        self.candidates = buckets[code]
+        self.solution = self.candidates[0]
+
+        feedback = Feedback.codeToString(code, len(word))
+        self.rounds.append((word, feedback))
+        return feedback
+
+
+def runAdversarial(games, models=None):
+    """Plays each model against the adversarial host and prints how they held
+    up: the wins, the most guesses needed (7 meaning a loss), how many games
+    were forfeited, and how long their moves took.
+
+    The host is deterministic, so the models that don't guess randomly will
+    play the same game every time; games only matters for the others.
+    """
+    models = list(Tournament.MODELS) if models is None else list(models)
+    game = AdversarialGame()
+    print()
+    print(" WORDLE SOLVERS VS. THE ADVERSARY")
+    print(" --------------------------------")
+    print()
+    print(" " + "Model".ljust(15) + "Wins".rjust(7) + "Worst".rjust(7) +
+          "Forfeit".rjust(9) + "Avg. Move (ms)".rjust(16) +
+          "Max Move (ms)".rjust(15))
+    for name in models:
+        player = Tournament.MODELS[name](game)
+        wins = 0
+        worst = 0
+        forfeits = 0
+        moves = []
+        for j in range(games):
+            game.reset()
+            player.reset(game)
+            score, failed, times = Tournament.playTimedGame(player, game)
+            wins += 1 if score > 0 else 0
+            forfeits += 1 if failed else 0
+            worst = max(worst, 7 - score)
+            moves += times
+        avgMove = sum(moves) / len(moves) * 1000 if moves else 0.0
+        maxMove = max(moves, default=0.0) * 1000
+        print(" " + name.ljust(15) + str(wins).rjust(7) + str(worst).rjust(7) +
+              str(forfeits).rjust(9) + format(avgMove, ".3f").rjust(16) +
+              format(maxMove, ".3f").rjust(15))
+    print()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Plays the solvers against a worst-case Wordle host.")
+    parser.add_argument("games", type=int, nargs="?", default=10)
+    parser.add_argument("--models", nargs="+", choices=list(Tournament.MODELS),
+                        help="models to play (default: all)")
+    args = parser.parse_args()
+    runAdversarial(args.games, args.models)
@@ -0,0 +1,144 @@
+"""Wordle feedback evaluation, shared by the game hosts and simulation runners.
+
+The feedback for a guess is a string the same length as the guess:
+
+  - '_' Means the corresponding character in the guess is not in the solution
+    at all
+  - 'Y' Means the corresponding character in the guess is in the solution, but
+    in the wrong position
+  - 'G' Means the corresponding character in the guess is in the solution in
+    that position
+"""
+
+def evaluate(word, solution):
+    """Returns the feedback string for guessing word when the answer is
+    solution. This is the same two-pass approach the Game classes have always
+    used, pulled out so that anything that needs feedback (without a Game
+    object to log rounds on) can share it.
+    """
+    # Keep track of letters that are matched; removing them from consideration
+    # so that double-matching for any reason is impossible.
+    wordUnchecked = list(word)
+    solnUnchecked = list(solution)
+    output = ["_"] * len(word)  # Defaults to unmatched
+
+    # Exact matches take priority and should exclude the inexact variant
+    # matches from happening, so they get their own pass first.
+    for i in range(len(word)):
+        if wordUnchecked[i] == solnUnchecked[i]:
+            output[i] = "G"
+            # '.' is sentinel below to skip that index
+            wordUnchecked[i] = "."
+            solnUnchecked[i] = "."
+
+    # Exact matches are no longer in the set, so inexact matches are all that's
+    # left
+    for i in range(len(word)):
+        if wordUnchecked[i] == ".":
+            continue
+        elif wordUnchecked[i] in solnUnchecked:
+            # Match to the first unchecked occurence in the word, then don't
+            # match to that occurence again.
+            solnUnchecked.remove(wordUnchecked[i])
+            output[i] = "Y"
+
+    return "".join(output)
+
+
+BLANK, YELLOW, GREEN = 0, 1, 2
+"""The value of each mark in a feedback code. A feedback code packs the marks
+for a whole guess into one integer, as base 3 digits with the first letter's
+mark the most significant, so it can be used as a dictionary key or an array
+index without building a string.
+"""
+MARKS = "_YG"
+
+
+def evaluateCode(word, solution):
+    """Returns the feedback for guessing word when the answer is solution, as a
+    feedback code rather than a string. Same rules as evaluate(), but this one
+    is called in tight loops so it skips the string handling.
+    """
+    n = len(word)
+    marks = [BLANK] * n
+    spare = []      # Letters of the solution that weren't exactly matched
+    for i in range(n):
+        if word[i] == solution[i]:
+            marks[i] = GREEN
+        else:
+            spare.append(solution[i])
+    if spare:
+        for i in range(n):
+            if marks[i] == BLANK and word[i] in spare:
+                spare.remove(word[i])
+                marks[i] = YELLOW
+    code = 0
+    for mark in marks:
+        code = code * 3 + mark
+    return code
+
+
+def allGreen(length=5):
+    """The feedback code for a correct guess."""
+    return 3 ** length - 1
+
+
+def codeToString(code, length=5):
+    """Converts a feedback code back into the feedback string evaluate() would
+    have returned.
+    """
+    output = []
+    for i in range(length):
+        output.append(MARKS[code % 3])
+        code //= 3
+    return "".join(reversed(output))
+
+
+def stringToCode(feedback):
+    """Converts a feedback string into its feedback code."""
+    code = 0
+    for mark in feedback:
+        code = code * 3 + MARKS.index(mark)
+    return code
+
+
+def partition(guess, candidates):
+    """Splits candidates into buckets by the feedback guess would get if each of
+    them were the solution.
+
+    Most guesses don't repeat a letter, and then there's no need to track which
+    letters of the solution have been used up: a letter is green if it's in the
+    same spot, yellow if it's anywhere else in the word, and blank otherwise.
+    That's a lot cheaper than the full evaluation, so those guesses get bucketed
+    with it and only guesses with repeated letters fall back on evaluateCode().
+
+    Returns:
+        A dictionary mapping each feedback code to the list of candidates that
+        would produce it, in their original order.
+    """
+    buckets = {}
+    n = len(guess)
+    if len(set(guess)) == n:
+        checks = [(i, guess[i], 3 ** (n - 1 - i)) for i in range(n)]
+        for candidate in candidates:
+            code = 0
+            for i, letter, weight in checks:
+                if candidate[i] == letter:
+                    code += weight + weight
+                elif letter in candidate:
+                    code += weight
+            bucket = buckets.get(code)
+            if bucket is None:
+                buckets[code] = [candidate]
+            else:
+                bucket.append(candidate)
+        return buckets
+
+    for candidate in candidates:
+        code = evaluateCode(guess, candidate)
+        bucket = buckets.get(code)
+        if bucket is None:
+            buckets[code] = [candidate]
+        else:
+            bucket.append(candidate)
+    return buckets
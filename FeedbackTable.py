@@ -0,0 +1,282 @@
+"""Guess x solution tables of feedback codes, computed with NumPy.
+
+The players that look ahead (the Mk VI, and anything else that wants to know
+how a guess would split up the candidates) need the feedback for thousands of
+guesses against every remaining candidate, every move. Working each of those
+out with Feedback.evaluateCode() is far too slow, so instead the feedback for
+every guess against every solution is worked out once, a whole block of
+guesses at a time, and kept in a table: table[guess id, solution position] is
+the feedback code (see Feedback.py) for that guess when that's the answer.
+
+For the full dictionaries that's 12,972 x 2,315 one-byte codes, about 30 MB,
+for every process that builds one. Where that's too much (bigger dictionaries,
+or lots of worker processes), a CappedTable works out rows as they're asked
+for and keeps as many as fit in a memory cap.
+
+Like VectorScoring, this needs NumPy.
+"""
+import argparse
+import time
+
+import SharedCache
+import VectorScoring
+import WordIndex
+
+np = VectorScoring.np
+BLOCK = 512
+"""How many guesses' rows are computed at once. Each block works with a few
+(BLOCK x solutions) temporary arrays, so this bounds the extra memory used
+while building a table.
+"""
+
+
+def feedbackCodes(guesses, solns):
+    """Computes the feedback code for every pair of an encoded guess and an
+    encoded solution (see VectorScoring.encodeWords).
+
+    This follows the same rules as Feedback.evaluate(): exact matches first,
+    then each remaining guess letter, left to right, is yellow if the solution
+    has an unmatched copy of it that no earlier guess letter has claimed.
+
+    Returns:
+        A (guesses x solutions) array of feedback codes.
+    """
+    length = guesses.shape[1]
+    g = guesses[:, np.newaxis, :]
+    s = solns[np.newaxis, :, :]
+    green = g == s
+    yellow = np.zeros(green.shape, dtype=bool)
+    for i in range(length):
+        letter = g[:, :, i, np.newaxis]
+        # Copies of the letter in the solution that weren't exactly matched...
+        available = ((s == letter) & ~green).sum(axis=2)
+        # ...less the ones already claimed by yellows earlier in the guess.
+        claimed = ((g[:, :, :i] == letter) & yellow[:, :, :i]).sum(axis=2)
+        yellow[:, :, i] = ~green[:, :, i] & (available > claimed)
+    marks = green.astype(np.int32) * 2 + yellow
+    weights = 3 ** np.arange(length - 1, -1, -1, dtype=np.int32)
+    codes = (marks * weights).sum(axis=2)
+    return codes.astype(codeType(length))
+
+
+def wordLength(index):
+    """The length of the words in a WordIndex (0 if it's empty)."""
+    return len(index.words[0]) if index.words else 0
+
+
+def codeType(length=5):
+    """The array type feedback codes for words of this length are stored as.
+    Five letter codes only go up to 242, so they fit in a byte.
+    """
+    return np.uint8 if 3 ** length <= 256 else np.int32
+
+
+def computeRows(index, guessIds, out=None):
+    """Computes the table rows for the given guess ids against every solution
+    in a WordIndex, a block at a time.
+
+    Args:
+        index: The WordIndex whose words and solutions the table covers.
+        guessIds: The ids of the guesses to compute rows for.
+        out: An array to write the rows into (one row per guess id); a new one
+          is made if this isn't given.
+
+    Returns:
+        The rows, as a (len(guessIds) x solutions) array.
+    """
+    VectorScoring.requireNumpy()
+    engine = VectorScoring.engineFor(index)
+    solns = engine.matrix[np.asarray(index.solnIds, dtype=np.intp)]
+    guessIds = np.asarray(guessIds, dtype=np.intp)
+    if out is None:
+        out = np.empty((len(guessIds), len(index.solnIds)), dtype=codeType(
+            engine.matrix.shape[1]))
+    for start in range(0, len(guessIds), BLOCK):
+        block = guessIds[start:start + BLOCK]
+        out[start:start + len(block)] = feedbackCodes(engine.matrix[block],
+                                                      solns)
+    return out
+
+
+def buildTable(index, out=None):
+    """Computes the full table for a WordIndex: a row for every guess, in id
+    order. If out is given (e.g. an array over shared memory) the table is
+    written into it.
+    """
+    return computeRows(index, np.arange(len(index.words)), out)
+
+
+tables = SharedCache.SharedCache()
+"""This process's full tables, by WordIndex."""
+
+
+def existingTable(index=None):
+    """This process's full table for a WordIndex (the shared one by default)
+    if it's already been built, otherwise None. Nothing is built.
+    """
+    index = index if index is not None else WordIndex.sharedIndex()
+    return tables.peek(index)
+
+
+def sharedTable(index=None):
+    """Returns this process's full table for a WordIndex (the shared one by
+    default), building it the first time it's asked for. The table is
+    read-only, since everything in the process shares it.
+    """
+    index = index if index is not None else WordIndex.sharedIndex()
+    return tables.get(index, lambda: _frozenTable(index))
+
+
+def _frozenTable(index):
+    table = buildTable(index)
+    table.flags.writeable = False
+    return table
+
+
+class CappedTable:
+    """A feedback table that works out rows when they're asked for and keeps
+    the most recently used ones, up to maxBytes of them.
+
+    It's indexed like the full table (table[guess id] for a row, table[a:b]
+    for a range of rows), so anything that reads a table can be given one.
+    Single rows are the hot ones (the guesses actually played, every game), so
+    looking one up keeps it, evicting the least recently used rows to make
+    room. Ranges are the bulk scans over every guess that choosing a move
+    does; rows they work out are only kept while there's spare room, so one
+    scan can't push out all the hot rows just to make way for rows the next
+    scan will push out in turn. Tables are safe to share between threads.
+
+    Attributes:
+        index: The WordIndex the table covers.
+        maxBytes: The most memory the kept rows may take up.
+        shape: The (guesses x solutions) shape of the full table.
+        dtype: The type of the codes (see codeType()).
+        rows: The SharedCache.LruCache of kept rows, by guess id, which counts
+          the hits, misses and evictions.
+    """
+
+    def __init__(self, index=None, maxBytes=8 * 2 ** 20):
+        """Covers a WordIndex (the shared one by default), keeping at most
+        maxBytes of rows (none, if it's 0).
+        """
+        VectorScoring.requireNumpy()
+        self.index = index if index is not None else WordIndex.sharedIndex()
+        self.maxBytes = maxBytes
+        length = wordLength(self.index)
+        self.shape = (len(self.index.words), len(self.index.solnIds))
+        self.dtype = np.dtype(codeType(length))
+        self.rows = SharedCache.LruCache(maxBytes, size=lambda row: row.nbytes)
+
+    @property
+    def bytesUsed(self):
+        """The memory taken up by the kept rows."""
+        return self.rows.used
+
+    def hitRate(self):
+        """The fraction of rows asked for that were already worked out."""
+        return self.rows.hitRate()
+
+    def stats(self):
+        """The table's counters as a dictionary, for reports."""
+        stats = self.rows.stats()
+        return {"hits": stats["hits"], "misses": stats["misses"],
+                "evictions": stats["evictions"], "hitRate": stats["hitRate"],
+                "rows": stats["entries"], "bytesUsed": stats["used"],
+                "maxBytes": self.maxBytes}
+
+    def computeRow(self, guessId):
+        row = computeRows(self.index, [guessId])[0]
+        row.flags.writeable = False
+        return row
+
+    def row(self, guessId):
+        """The row for one guess, keeping it as the most recently used."""
+        return self.rows.getOrBuild(guessId, lambda: self.computeRow(guessId))
+
+    def rowsFor(self, guessIds):
+        """The rows for a sequence of guess ids, as a new array. Rows that
+        aren't already kept are only kept if there's room to spare.
+        """
+        guessIds = np.asarray(guessIds, dtype=np.intp)
+        out = np.empty((len(guessIds), self.shape[1]), dtype=self.dtype)
+        missing = []
+        for i, guessId in enumerate(guessIds.tolist()):
+            row = self.rows.get(guessId)
+            if row is None:
+                missing.append(i)
+            else:
+                out[i] = row
+        if missing:
+            ids = guessIds[missing]
+            computed = computeRows(self.index, ids)
+            out[missing] = computed
+            for guessId, row in zip(ids.tolist(), computed):
+                # A copy, so the kept row doesn't hold on to the block.
+                row = row.copy()
+                row.flags.writeable = False
+                if not self.rows.put(guessId, row, evict=False):
+                    break
+        return out
+
+    def __getitem__(self, key):
+        """Indexes the table like the full array: by guess id, by a slice of
+        guess ids, or by (guess ids, solution positions).
+        """
+        if isinstance(key, tuple):
+            rows, columns = key
+            return self[rows][columns]
+        if isinstance(key, slice):
+            return self.rowsFor(range(*key.indices(self.shape[0])))
+        return self.row(int(key))
+
+    def __len__(self):
+        return self.shape[0]
+
+
+def tableFor(index=None, maxBytes=None):
+    """The table to use for a WordIndex (the shared one by default): the
+    process's full table, or a new CappedTable if there's a memory cap.
+    """
+    if maxBytes is None:
+        return sharedTable(index)
+    return CappedTable(index, maxBytes)
+
+
+if __name__ == "__main__":
+    import random
+    import wss      # Here, since wss uses this module through MoveSelection.
+    import MoveSelection
+
+    parser = argparse.ArgumentParser(
+        description="Plays the Mk VI with feedback tables capped at different "
+                    "sizes, to show how much each cap costs in speed.")
+    parser.add_argument("caps", type=float, nargs="*", default=[0, 4, 16, 32],
+                        help="memory caps to try, in MB")
+    parser.add_argument("--games", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    print()
+    print(" " + "Cap (MB)".ljust(10) + "Used (MB)".rjust(10) +
+          "Hit rate (%)".rjust(13) + "Evictions".rjust(11) +
+          "Games/s".rjust(10))
+    for cap in args.caps:
+        table = CappedTable(maxBytes=int(cap * 2 ** 20))
+        selector = MoveSelection.MoveSelector(table.index, table)
+        game = wss.Game(rng=random.Random(args.seed))
+        # Every cap works out its own opening move, rather than the first one
+        # doing it for all of them.
+        wss.AutoPlayer_MkVI.openingChoices.clear()
+        player = wss.AutoPlayer_MkVI(game, selector)
+        start = time.perf_counter()
+        for i in range(args.games):
+            wss.wordleGameLoop(player, game)
+            game.reset()
+            player.reset(game)
+        elapsed = time.perf_counter() - start
+        stats = table.stats()
+        print(" " + format(cap, ".1f").ljust(10) +
+              format(stats["bytesUsed"] / 2 ** 20, ".1f").rjust(10) +
+              format(stats["hitRate"] * 100, ".1f").rjust(13) +
+              str(stats["evictions"]).rjust(11) +
+              format(args.games / elapsed, ".2f").rjust(10), flush=True)
+    print()
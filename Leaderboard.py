@@ -0,0 +1,200 @@
+import argparse
+import csv
+import json
+import random
+import statistics
+import time
+import tracemalloc
+
+import AdversarialGame
+import FeedbackTable
+import Tournament
+import VectorScoring
+import wss
+
+COLUMNS = ["model", "games", "avgGuesses", "failureRate", "setupMs",
+           "gamesPerSecond", "p50MoveMs", "p99MoveMs", "peakMemoryKb",
+           "forfeits"]
+
+
+def percentile(values, pct):
+    """The pct-th percentile of values (linear interpolation between the
+    closest ranks), or 0.0 if there aren't any.
+    """
+    if not values:
+        return 0.0
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[pct - 1]
+
+
+def clearSharedCaches():
+    """Empties the caches the players build up and share within a process
+    (the feedback table, the scoring engines and the opening moves), so the
+    next model to need one pays for building it. The word index stays, since
+    every model uses it and the games were built around it.
+    """
+    FeedbackTable.tables.clear()
+    VectorScoring.engines.clear()
+    AdversarialGame.AdversarialGame.openingBuckets.clear()
+    wss.AutoPlayer_MkV.openingChoices.clear()
+    wss.AutoPlayer_MkVI.openingChoices.clear()
+
+
+def measureModel(name, solutions, seed=0, memoryGames=20):
+    """Measures one model playing the given solutions, from a standing start.
+
+    The shared caches are emptied before each pass, so a model is charged for
+    everything it builds: its feedback table or scoring engine, its opening
+    move, and so on. Setup is the time to build the player (which is when most
+    of them build their tables). The timed pass then plays every solution and
+    times each of the player's moves (the game's own work isn't counted in the
+    move times, but is in games per second; setup isn't counted in either).
+    Peak memory comes from a separate, shorter pass under tracemalloc, since
+    tracing allocations slows everything down too much to time with it on.
+    It's the most that building the player and playing added on top of what
+    was already allocated, so only the shared word lists don't count against
+    anyone.
+
+    Returns:
+        A dictionary with an entry for each of COLUMNS.
+    """
+    random.seed(seed)
+    clearSharedCaches()
+    start = time.perf_counter()
+    game = wss.Game(solutions[0] if solutions else None)
+    player = Tournament.MODELS[name](game)
+    setup = time.perf_counter() - start
+    moves = []
+    guesses = []
+    failures = 0
+    forfeits = 0
+    start = time.perf_counter()
+    for soln in solutions:
+        game.reset(soln)
+        player.reset(game)
+        score, failed, times = Tournament.playTimedGame(player, game)
+        moves += times
+        if score > 0:
+            guesses.append(7 - score)
+        else:
+            failures += 1
+        forfeits += 1 if failed else 0
+    elapsed = time.perf_counter() - start
+
+    random.seed(seed)
+    clearSharedCaches()
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        game = wss.Game(solutions[0] if solutions else None)
+        player = Tournament.MODELS[name](game)
+        for soln in solutions[:memoryGames]:
+            game.reset(soln)
+            player.reset(game)
+            Tournament.playGame(player, game)
+        peak = tracemalloc.get_traced_memory()[1] - base
+    finally:
+        tracemalloc.stop()
+
+    moveMs = [t * 1000 for t in moves]
+    return {
+        "model": name,
+        "games": len(solutions),
+        "avgGuesses": round(statistics.fmean(guesses), 3) if guesses else 0.0,
+        "failureRate": round(failures / len(solutions), 4)
+                       if solutions else 0.0,
+        "setupMs": round(setup * 1000, 1),
+        "gamesPerSecond": round(len(solutions) / elapsed, 2)
+                          if elapsed > 0 else 0.0,
+        "p50MoveMs": round(percentile(moveMs, 50), 4),
+        "p99MoveMs": round(percentile(moveMs, 99), 4),
+        "peakMemoryKb": round(peak / 1024, 1),
+        "forfeits": forfeits,
+    }
+
+
+def runLeaderboard(iterations, models=None, seed=0, memoryGames=20):
+    """Measures every model (all of them by default) on the same randomly
+    chosen solutions, printing each row as it's finished.
+
+    Returns:
+        The list of results, fewest failures first (fewest average guesses
+        breaking ties).
+    """
+    models = list(Tournament.MODELS) if models is None else list(models)
+    solutions = Tournament.drawSolutions(iterations, seed)
+    print()
+    print(" WORDLE SOLVER LEADERBOARD")
+    print(" -------------------------")
+    print()
+    print(" Every solver plays the same " + str(iterations) + " randomly chosen"
+          + " words. Average guesses only counts wins; failures are losses "
+          + "and forfeits. Setup (building the player and anything it "
+          + "caches) isn't counted in games per second. Peak memory includes "
+          + "setup and is measured over the first " +
+          str(min(memoryGames, iterations)) + " games.")
+    print()
+    printHeader()
+    results = []
+    for name in models:
+        result = measureModel(name, solutions, seed, memoryGames)
+        printRow(result)
+        results.append(result)
+    results.sort(key=lambda r: (r["failureRate"], r["avgGuesses"]))
+    print()
+    print(" RANKED")
+    printHeader()
+    for result in results:
+        printRow(result)
+    print()
+    return results
+
+
+def printHeader():
+    print(" " + "Model".ljust(15) + "Avg. Guesses".rjust(13) +
+          "Fail (%)".rjust(10) + "Setup (ms)".rjust(12) + "Games/s".rjust(10) +
+          "p50 (ms)".rjust(10) + "p99 (ms)".rjust(10) +
+          "Peak (KB)".rjust(11))
+
+
+def printRow(result):
+    print(" " + result["model"].ljust(15) +
+          format(result["avgGuesses"], ".3f").rjust(13) +
+          format(result["failureRate"] * 100, ".2f").rjust(10) +
+          format(result["setupMs"], ".1f").rjust(12) +
+          format(result["gamesPerSecond"], ".1f").rjust(10) +
+          format(result["p50MoveMs"], ".3f").rjust(10) +
+          format(result["p99MoveMs"], ".3f").rjust(10) +
+          format(result["peakMemoryKb"], ".1f").rjust(11), flush=True)
+
+
+def saveResults(results, path):
+    """Saves the results as JSON, or as CSV if path ends in .csv."""
+    if path.endswith(".csv"):
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=COLUMNS)
+            writer.writeheader()
+            writer.writerows(results)
+    else:
+        with open(path, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Ranks the solvers by quality, throughput and latency.")
+    parser.add_argument("iterations", type=int, nargs="?", default=100)
+    parser.add_argument("--models", nargs="+", choices=list(Tournament.MODELS),
+                        help="models to measure (default: all)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--memory-games", type=int, default=20,
+                        help="games to play while measuring peak memory")
+    parser.add_argument("--out", metavar="PATH",
+                        help="save the results as JSON (or CSV, for .csv)")
+    args = parser.parse_args()
+    results = runLeaderboard(args.iterations, args.models, args.seed,
+                             args.memory_games)
+    if args.out:
+        saveResults(results, args.out)
@@ -0,0 +1,282 @@
+"""Choosing a guess by how well it splits up the remaining candidates, either
+in this process or fanned out over a pool of worker processes.
+
+A guess is scored by the sum of the squares of the sizes of the buckets it
+splits the candidates into (one bucket per feedback code). Divided by the
+number of candidates, that's how many candidates we'd expect to have left
+after playing it, so lower is better. Scoring every legal guess like this is
+the expensive part of a move: it's thousands of rows of the feedback table
+(see FeedbackTable.py) read against every candidate.
+
+The guesses are scored in contiguous ranges of ids, and each range gives back
+its best (score, not a candidate, id) triple, so the best of those is the best
+overall. A MoveSelector scores every range itself; a ParallelMoveSelector
+keeps the table and the candidates in shared memory and hands the ranges out
+to worker processes, which is worth it on a multi-core machine while there are
+still lots of candidates. Both need NumPy.
+"""
+import argparse
+import concurrent.futures
+import os
+import threading
+import time
+from multiprocessing import shared_memory
+
+import Feedback
+import FeedbackTable
+import VectorScoring
+import WordIndex
+
+np = VectorScoring.np
+
+
+def solutionPositions(index):
+    """An array mapping every guess id to its position in the solution list,
+    or -1 for guesses that can't be the answer.
+    """
+    positions = np.full(len(index.words), -1, dtype=np.int32)
+    for id, position in index.solnPositions.items():
+        positions[id] = position
+    return positions
+
+
+def codeCount(index):
+    """The number of possible feedback codes for the words in a WordIndex
+    (3 ** the word length).
+    """
+    return Feedback.allGreen(FeedbackTable.wordLength(index)) + 1
+
+
+def bestMove(table, candidates, solnOf, codes, start=0, stop=None):
+    """Finds the best guess with an id in range(start, stop).
+
+    Args:
+        table: The feedback table (or anything that gives the same rows when
+          sliced by guess id).
+        candidates: An array of the solution positions still possible.
+        solnOf: The array from solutionPositions().
+        codes: The number of possible feedback codes (see codeCount()).
+        start, stop: The range of guess ids to consider. Defaults to all of
+          them.
+
+    Returns:
+        A (score, notCandidate, guessId) tuple for the best guess in the
+        range: the smallest sum of squared bucket sizes, then a guess that
+        could be the answer, then the lowest id. None if the range is empty.
+    """
+    stop = table.shape[0] if stop is None else stop
+    isCandidate = np.zeros(table.shape[1] + 1, dtype=bool)
+    isCandidate[candidates] = True     # The last entry stays False for -1.
+    best = None
+    for low in range(start, stop, FeedbackTable.BLOCK):
+        high = min(low + FeedbackTable.BLOCK, stop)
+        # Offset each row's codes so that one bincount counts every row's
+        # buckets separately.
+        rows = table[low:high][:, candidates].astype(np.intp)
+        rows += np.arange(high - low, dtype=np.intp)[:, np.newaxis] * codes
+        sizes = np.bincount(rows.ravel(), minlength=(high - low) * codes)
+        scores = (sizes.reshape(high - low, codes).astype(np.int64) ** 2) \
+            .sum(axis=1)
+        notCandidate = ~isCandidate[solnOf[low:high]]
+        # Lexical order of (score, notCandidate, id): the ids are already in
+        # order, so the first of the lowest keys is the best in this block.
+        keys = scores * 2 + notCandidate
+        i = int(np.argmin(keys))
+        result = (int(scores[i]), bool(notCandidate[i]), low + i)
+        if best is None or result < best:
+            best = result
+    return best
+
+
+class MoveSelector:
+    """Chooses moves in this process, from the full feedback table or a capped
+    one.
+
+    Attributes:
+        index: The WordIndex the table covers.
+        table: The feedback table, table[guess id, solution position].
+        solnOf: Maps each guess id to its solution position (see
+          solutionPositions()).
+        codes: The number of possible feedback codes (see codeCount()).
+    """
+
+    def __init__(self, index=None, table=None, maxBytes=None):
+        """Uses the given table, or else the process's shared table for the
+        index (the shared one by default), or a FeedbackTable.CappedTable if
+        there's a memory cap (maxBytes).
+        """
+        VectorScoring.requireNumpy()
+        self.index = index if index is not None else WordIndex.sharedIndex()
+        self.table = table if table is not None else \
+            FeedbackTable.tableFor(self.index, maxBytes)
+        self.solnOf = solutionPositions(self.index)
+        self.solnOf.flags.writeable = False
+        self.codes = codeCount(self.index)
+
+    def best(self, candidates):
+        """The id of the best guess against the candidates (an array of
+        solution positions).
+        """
+        return self.choose(candidates)[0]
+
+    def choose(self, candidates):
+        """The best guess against the candidates, as a pair of its id and the
+        number of candidates it's expected to leave.
+        """
+        score, notCandidate, guessId = bestMove(self.table, candidates,
+                                                self.solnOf, self.codes)
+        return guessId, score / len(candidates)
+
+    def close(self):
+        """Nothing to free here; see ParallelMoveSelector.close()."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# The worker processes' views of the shared table and candidates, set up by
+# _attach() when each worker starts.
+_worker = {}
+
+
+def _attach(tableName, shape, dtype, candidatesName, solnOf, codes):
+    tableMemory = shared_memory.SharedMemory(name=tableName)
+    candidatesMemory = shared_memory.SharedMemory(name=candidatesName)
+    table = np.ndarray(shape, dtype=dtype, buffer=tableMemory.buf)
+    table.flags.writeable = False
+    candidates = np.ndarray(shape[1], dtype=np.int32,
+                            buffer=candidatesMemory.buf)
+    _worker.update(memory=(tableMemory, candidatesMemory), table=table,
+                   solnOf=solnOf, codes=codes, candidates=candidates)
+
+
+def _bestInRange(count, start, stop):
+    return bestMove(_worker["table"], _worker["candidates"][:count],
+                    _worker["solnOf"], _worker["codes"], start, stop)
+
+
+class ParallelMoveSelector(MoveSelector):
+    """Chooses moves by splitting the guesses between worker processes.
+
+    The table is put in a block of shared memory (copied from the process's
+    own table if it's already been built, otherwise built straight into it),
+    and each move's candidates are written into a second one, so the workers
+    read both without anything being copied to them; all that goes back and
+    forth per move is a range of guess ids out and a best guess back. With
+    only a few candidates left the work is too small to be worth sending out,
+    so it's done here.
+
+    A selector can be shared by any number of players, but only makes one move
+    at a time. Close it (or use it in a with block) to stop the workers and
+    free the shared memory.
+
+    Attributes:
+        workers: The number of worker processes.
+        minCandidates: The fewest candidates worth using the workers for.
+    """
+
+    def __init__(self, index=None, workers=None, minCandidates=64):
+        VectorScoring.requireNumpy()
+        self.index = index if index is not None else WordIndex.sharedIndex()
+        self.workers = workers or os.cpu_count() or 1
+        self.minCandidates = minCandidates
+        self.solnOf = solutionPositions(self.index)
+        self.solnOf.flags.writeable = False
+        self.codes = codeCount(self.index)
+        self.lock = threading.Lock()
+        length = FeedbackTable.wordLength(self.index)
+        shape = (len(self.index.words), len(self.index.solnIds))
+        dtype = np.dtype(FeedbackTable.codeType(length))
+        self.tableMemory = shared_memory.SharedMemory(
+            create=True, size=max(1, shape[0] * shape[1] * dtype.itemsize))
+        self.candidatesMemory = shared_memory.SharedMemory(
+            create=True, size=max(1, shape[1] * 4))
+        self.pool = None
+        try:
+            self.table = np.ndarray(shape, dtype=dtype,
+                                    buffer=self.tableMemory.buf)
+            existing = FeedbackTable.existingTable(self.index)
+            if existing is not None:
+                self.table[:] = existing
+            else:
+                FeedbackTable.buildTable(self.index, out=self.table)
+            self.table.flags.writeable = False
+            self.candidates = np.ndarray(shape[1], dtype=np.int32,
+                                         buffer=self.candidatesMemory.buf)
+            self.pool = concurrent.futures.ProcessPoolExecutor(
+                self.workers, initializer=_attach,
+                initargs=(self.tableMemory.name, shape, dtype,
+                          self.candidatesMemory.name, self.solnOf,
+                          self.codes))
+        except BaseException:
+            self.close()
+            raise
+
+    def choose(self, candidates):
+        """The best guess against the candidates (an array of solution
+        positions), as a pair of its id and the number of candidates it's
+        expected to leave, worked out by the workers if there are enough
+        candidates.
+        """
+        if len(candidates) < self.minCandidates or self.workers < 2:
+            return super().choose(candidates)
+        with self.lock:
+            self.candidates[:len(candidates)] = candidates
+            # A few ranges per worker, so one slow worker doesn't hold up the
+            # whole move.
+            guesses = self.table.shape[0]
+            step = -(-guesses // (self.workers * 4))
+            futures = [self.pool.submit(_bestInRange, len(candidates), start,
+                                        min(start + step, guesses))
+                       for start in range(0, guesses, step)]
+            results = [future.result() for future in futures]
+        score, notCandidate, guessId = min(result for result in results
+                                           if result is not None)
+        return guessId, score / len(candidates)
+
+    def close(self):
+        """Stops the workers and frees the shared memory. The table can't be
+        used afterwards.
+        """
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+        # Drop our views first; shared memory can't be closed while an array
+        # still points into it.
+        self.table = self.candidates = None
+        for memory in (self.tableMemory, self.candidatesMemory):
+            if memory is not None:
+                memory.close()
+                memory.unlink()
+        self.tableMemory = self.candidatesMemory = None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Times choosing the opening move in this process and "
+                    "with a pool of worker processes.")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes (default: one per CPU)")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    index = WordIndex.sharedIndex()
+    everything = np.arange(len(index.solnIds), dtype=np.int32)
+    with ParallelMoveSelector(index, args.workers) as parallel:
+        local = MoveSelector(index, parallel.table)
+        parallel.best(everything)      # Starts the workers.
+        print()
+        print(" " + "Selector".ljust(15) + "Best move".rjust(10) +
+              "Time (ms)".rjust(11))
+        for name, selector in (("In process", local),
+                               ("Workers (" + str(parallel.workers) + ")",
+                                parallel)):
+            start = time.perf_counter()
+            for i in range(args.repeat):
+                move = selector.best(everything)
+            elapsed = (time.perf_counter() - start) / args.repeat
+            print(" " + name.ljust(15) + index.wordOf(move).rjust(10) +
+                  format(elapsed * 1000, ".1f").rjust(11))
+        print()
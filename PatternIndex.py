@@ -0,0 +1,171 @@
+import argparse
+import sys
+
+import Feedback
+import SharedCache
+import WordIndex
+
+DEFAULT_OPENERS = ("caret", "loins", "crane", "slate", "soare", "salet",
+                   "trace", "raise", "roate", "adieu")
+"""Common opening guesses, whose buckets are built up front. The Mk III's
+starters are in here, along with the usual suspects from the internet.
+"""
+
+
+class PatternIndex:
+    """An inverted index from (guess, feedback) to the solutions consistent
+    with it.
+
+    For each indexed guess, the solution list is split into buckets by the
+    feedback that guess would get, and each bucket is stored as a frozenset of
+    solution ids (see WordIndex). The solutions left after a whole transcript
+    of guesses and feedback are then just the intersection of one bucket per
+    round, with no players or replaying involved.
+
+    The openers are indexed when the index is built. Any other guess is
+    indexed the first time it's asked about, and up to lazyLimit of those are
+    kept, least recently used going first. Indexes are safe to share between
+    threads.
+    """
+
+    def __init__(self, index=None, openers=DEFAULT_OPENERS, lazyLimit=1000):
+        """Builds the index over a WordIndex (the shared one by default), with
+        the given opening guesses indexed up front.
+
+        Raises:
+            KeyError: If one of the openers isn't a legal guess.
+        """
+        self.index = index if index is not None else WordIndex.sharedIndex()
+        self.lazyLimit = lazyLimit
+        self.pinned = {}
+        self.lazy = SharedCache.LruCache(lazyLimit)
+        for opener in openers:
+            guessId = self.index.idOf(opener)
+            self.pinned[guessId] = self.buildBuckets(guessId)
+
+    def buildBuckets(self, guessId):
+        """Splits the solutions by the feedback the guess with this id gets.
+
+        Returns:
+            A dictionary mapping each feedback code to the frozenset of ids of
+            the solutions that produce it.
+        """
+        ids = self.index.ids
+        buckets = Feedback.partition(self.index.wordOf(guessId),
+                                     self.index.solnWords)
+        return {code: frozenset(ids[word] for word in bucket)
+                for code, bucket in buckets.items()}
+
+    def bucketsFor(self, guessId):
+        """The buckets for a guess, indexing it now if it isn't already."""
+        buckets = self.pinned.get(guessId)
+        if buckets is not None:
+            return buckets
+        return self.lazy.getOrBuild(guessId,
+                                    lambda: self.buildBuckets(guessId))
+
+    def consistent(self, guess, feedback):
+        """The ids of the solutions consistent with one round, as a frozenset.
+        The guess can be a word or an id, and the feedback a string or a
+        feedback code.
+
+        Raises:
+            KeyError: If the guess isn't a legal guess.
+            ValueError: If the feedback isn't one mark from "_YG" per letter
+              of the guess (or a code that could be written that way).
+        """
+        guessId = self.index.idOf(guess) if isinstance(guess, str) else guess
+        length = len(self.index.wordOf(guessId))
+        if isinstance(feedback, str):
+            if len(feedback) != length or \
+                    any(mark not in Feedback.MARKS for mark in feedback):
+                raise ValueError("Feedback '" + feedback + "' for '" +
+                                 self.index.wordOf(guessId) + "' should be " +
+                                 str(length) + " marks from '" +
+                                 Feedback.MARKS + "'.")
+            code = Feedback.stringToCode(feedback)
+        else:
+            code = feedback
+            if not 0 <= code <= Feedback.allGreen(length):
+                raise ValueError("Feedback code " + str(code) + " is out of " +
+                                 "range for a " + str(length) + " letter guess.")
+        return self.bucketsFor(guessId).get(code, frozenset())
+
+    def queryIds(self, transcript):
+        """The ids of the solutions consistent with every round of a
+        transcript (a sequence of (guess, feedback) pairs), as a set.
+        """
+        sets = sorted((self.consistent(guess, feedback)
+                       for guess, feedback in transcript), key=len)
+        if not sets:
+            return set(self.index.solnIds)
+        return set(sets[0]).intersection(*sets[1:])
+
+    def query(self, transcript):
+        """The solutions consistent with every round of a transcript, as words
+        in the order of the solution list.
+        """
+        positions = self.index.solnPositions
+        return [self.index.wordOf(id) for id in
+                sorted(self.queryIds(transcript), key=positions.__getitem__)]
+
+
+def parseTranscript(text):
+    """Parses a transcript written as 'guess:feedback' pairs separated by
+    spaces, e.g. 'caret:_YYY_ loins:_____'. The pairs themselves are checked
+    when they're queried (see PatternIndex.consistent()).
+
+    Raises:
+        ValueError: If something isn't a guess:feedback pair.
+    """
+    transcript = []
+    for pair in text.split():
+        guess, colon, feedback = pair.partition(":")
+        if not colon or not guess:
+            raise ValueError("'" + pair + "' isn't a guess:feedback pair.")
+        transcript.append((guess.lower(), feedback.upper()))
+    return transcript
+
+
+def queryLines(patterns, lines):
+    """Answers a transcript per line, printing how many solutions are left and
+    what they are. A bad line is reported (on standard error) and skipped,
+    rather than ending the run.
+    """
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            remaining = patterns.query(parseTranscript(line))
+        except KeyError as e:
+            print("line " + str(number) + ": " + str(e.args[0]) +
+                  " isn't a legal guess", file=sys.stderr)
+            continue
+        except ValueError as e:
+            print("line " + str(number) + ": " + str(e), file=sys.stderr)
+            continue
+        print(str(len(remaining)) + "\t" + " ".join(remaining))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Lists the solutions left after a transcript of guesses "
+                    "and feedback, e.g. caret:_YYY_ loins:_____")
+    parser.add_argument("rounds", nargs="*", help="guess:feedback pairs")
+    parser.add_argument("--file", help="a file of transcripts, one per line "
+                                       "('-' for standard input)")
+    args = parser.parse_args()
+    patterns = PatternIndex()
+    if args.rounds:
+        try:
+            remaining = patterns.query(parseTranscript(" ".join(args.rounds)))
+        except KeyError as e:
+            parser.error(str(e.args[0]) + " isn't a legal guess")
+        except ValueError as e:
+            parser.error(str(e))
+        print(" ".join(remaining))
+    if args.file == "-":
+        queryLines(patterns, sys.stdin)
+    elif args.file:
+        with open(args.file, "r") as lines:
+            queryLines(patterns, lines)
@@ -0,0 +1,407 @@
+import argparse
+import glob
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+import traceback
+
+import Tournament
+import wss
+
+VARIANTS = {"all": wss.DEFAULT_CONFIG,
+            "solns": wss.DEFAULT_CONFIG._replace(useSolns=True)}
+"""The dictionary variants a sweep can run each model with, mapped to the game
+config for that variant. Only the AutoPlayers read useSolns; the WordlePlayer
+models always use the lists they were built with.
+"""
+
+PENDING = "pending"
+CLAIMED = "claimed"
+RESULTS = "results"
+FAILED = "failed"
+DONE = "DONE"
+MAX_ATTEMPTS = 3
+"""How many times a shard is tried (counting workers lost while running it)
+before it's given up on and moved to the failed directory.
+"""
+
+
+def queuePath(queue, *parts):
+    return os.path.join(queue, *parts)
+
+
+def writeJson(path, data):
+    """Writes data to path in one step (by way of a temporary file), so that
+    nobody reading the queue ever sees a half written file.
+    """
+    tmpPath = path + "." + socket.gethostname() + "." + str(os.getpid()) + \
+        ".tmp"
+    with open(tmpPath, "w") as f:
+        json.dump(data, f)
+    os.replace(tmpPath, path)
+
+
+def readJson(path):
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def planShards(queue, solutions, models, variants, shardSize, seed=0):
+    """Sets up a queue directory and fills it with shards of work.
+
+    The parameter grid (every model with every dictionary variant) is crossed
+    with the solution list split into chunks of shardSize, and each of those is
+    written to the pending directory as a shard for a worker to pick up.
+
+    Returns:
+        The number of shards written.
+    """
+    for part in (PENDING, CLAIMED, RESULTS, FAILED):
+        os.makedirs(queuePath(queue, part), exist_ok=True)
+    for old in glob.glob(queuePath(queue, "*", "*.json")):
+        os.remove(old)
+    if os.path.exists(queuePath(queue, DONE)):
+        os.remove(queuePath(queue, DONE))
+
+    count = 0
+    for model in models:
+        for variant in variants:
+            for start in range(0, len(solutions), shardSize):
+                shard = {
+                    "id": str(count).zfill(6),
+                    "model": model,
+                    "variant": variant,
+                    "seed": seed + count,
+                    "solutions": solutions[start:start + shardSize],
+                    "attempts": 0,
+                    "errors": [],
+                }
+                writeJson(queuePath(queue, PENDING, shard["id"] + ".json"),
+                          shard)
+                count += 1
+    writeJson(queuePath(queue, "plan.json"), {"shards": count})
+    return count
+
+
+def claimShard(queue):
+    """Claims the next pending shard by moving it into the claimed directory.
+    A rename is atomic, so if two workers go for the same shard exactly one of
+    them gets it and the other just tries the next one.
+
+    Returns:
+        The path of the claimed shard, or None if nothing is pending.
+    """
+    for path in sorted(glob.glob(queuePath(queue, PENDING, "*.json"))):
+        claimed = queuePath(queue, CLAIMED, os.path.basename(path))
+        try:
+            os.rename(path, claimed)
+        except OSError:
+            continue
+        # A rename keeps the old modified time, which would make a freshly
+        # claimed shard look stale.
+        heartbeat(claimed)
+        return claimed
+    return None
+
+
+def heartbeat(path):
+    """Lets the coordinator know the worker holding this shard is still alive,
+    by touching the claimed shard file.
+    """
+    try:
+        os.utime(path)
+    except OSError:
+        pass    # The coordinator gave up on us and took it back; carry on.
+
+
+def runShard(shard, claimedPath=None):
+    """Plays every solution in a shard with the shard's model and variant.
+
+    Returns:
+        The shard's results: its identifying fields plus the list of scores,
+        one for each solution in order, and the number of forfeited games.
+    """
+    random.seed(shard["seed"])
+    game = wss.Game(shard["solutions"][0] if shard["solutions"] else None,
+                    VARIANTS[shard["variant"]])
+    player = Tournament.MODELS[shard["model"]](game)
+    scores = []
+    forfeits = 0
+    for soln in shard["solutions"]:
+        game.reset(soln)
+        player.reset(game)
+        score, failed = Tournament.playGame(player, game)
+        scores.append(score)
+        forfeits += 1 if failed else 0
+        if claimedPath:
+            heartbeat(claimedPath)
+    return {
+        "id": shard["id"],
+        "model": shard["model"],
+        "variant": shard["variant"],
+        "scores": scores,
+        "forfeits": forfeits,
+        "worker": socket.gethostname() + ":" + str(os.getpid()),
+    }
+
+
+def retryOrFail(queue, claimed, shard, error):
+    """Gives back a shard that couldn't be finished, noting the error and the
+    attempt. It goes back to pending for another try, or to the failed
+    directory once it's had MAX_ATTEMPTS, so a shard that always crashes
+    can't hold up the run forever.
+    """
+    shard["attempts"] = shard.get("attempts", 0) + 1
+    shard["errors"] = shard.get("errors", []) + [error]
+    done = shard["attempts"] >= MAX_ATTEMPTS
+    writeJson(queuePath(queue, FAILED if done else PENDING,
+                        os.path.basename(claimed)), shard)
+    try:
+        os.remove(claimed)
+    except OSError:
+        pass
+
+
+def worker(queue, poll=0.5):
+    """Runs shards from the queue until the coordinator says it's done.
+
+    Any number of workers can share a queue, on this machine or on others that
+    see the same directory. A worker with nothing to do waits for work to turn
+    up (the coordinator may still hand back a shard from a lost worker). A
+    shard that raises is handed back with the error (see retryOrFail()), and
+    the worker carries on with the next one.
+    """
+    while not os.path.exists(queuePath(queue, DONE)):
+        claimed = claimShard(queue)
+        if claimed is None:
+            time.sleep(poll)
+            continue
+        try:
+            shard = readJson(claimed)
+        except (OSError, ValueError):
+            continue    # Reassigned while we were opening it.
+        try:
+            result = runShard(shard, claimed)
+        except Exception:
+            print(" Shard " + shard["id"] + " failed:", file=sys.stderr)
+            traceback.print_exc()
+            retryOrFail(queue, claimed, shard, traceback.format_exc())
+            continue
+        writeJson(queuePath(queue, RESULTS, shard["id"] + ".json"), result)
+        try:
+            os.remove(claimed)
+        except OSError:
+            pass
+
+
+def reassignStale(queue, timeout):
+    """Hands any shard whose worker hasn't checked in for timeout seconds back
+    to the pending directory for somebody else to take. Losing the worker
+    counts as one of the shard's attempts, so a shard that keeps taking its
+    workers down with it ends up in the failed directory instead.
+
+    Returns:
+        The number of shards that were reassigned (or failed).
+    """
+    count = 0
+    now = time.time()
+    for path in glob.glob(queuePath(queue, CLAIMED, "*.json")):
+        try:
+            if now - os.path.getmtime(path) <= timeout:
+                continue
+            shard = readJson(path)
+        except (OSError, ValueError):
+            continue    # Finished (or reassigned) while we were looking at it.
+        retryOrFail(queue, path, shard, "Worker stopped checking in for " +
+                    str(timeout) + " seconds.")
+        count += 1
+    return count
+
+
+def failedShards(queue):
+    """The shards that were given up on, as read from the failed directory."""
+    return [readJson(path) for path in
+            sorted(glob.glob(queuePath(queue, FAILED, "*.json")))]
+
+
+def finishedCount(queue):
+    """The number of shards with a result or given up on."""
+    return len(glob.glob(queuePath(queue, RESULTS, "*.json"))) + \
+        len(glob.glob(queuePath(queue, FAILED, "*.json")))
+
+
+def mergeResults(queue):
+    """Merges every shard result file in the queue into one report.
+
+    Returns:
+        A dictionary mapping "model/variant" to that combination's number of
+        games, wins, forfeits, score total and score histogram, and the ids
+        of any of its shards that failed (whose games aren't counted).
+    """
+    report = {}
+
+    def entryFor(shard):
+        key = shard["model"] + "/" + shard["variant"]
+        return report.setdefault(key, {"model": shard["model"],
+                                       "variant": shard["variant"],
+                                       "games": 0, "wins": 0, "forfeits": 0,
+                                       "total": 0, "histogram": [0] * 7,
+                                       "failedShards": []})
+
+    for path in sorted(glob.glob(queuePath(queue, RESULTS, "*.json"))):
+        result = readJson(path)
+        entry = entryFor(result)
+        entry["games"] += len(result["scores"])
+        entry["wins"] += sum(1 for s in result["scores"] if s > 0)
+        entry["forfeits"] += result["forfeits"]
+        entry["total"] += sum(result["scores"])
+        for s in result["scores"]:
+            entry["histogram"][s] += 1
+    for shard in failedShards(queue):
+        if not os.path.exists(queuePath(queue, RESULTS, shard["id"] + ".json")):
+            entryFor(shard)["failedShards"].append(shard["id"])
+    return report
+
+
+def printReport(report, failed=()):
+    """Prints the merged report, and then the shards that failed (as read by
+    failedShards()) with the last error each of them hit.
+    """
+    print()
+    print(" " + "Model/Variant".ljust(22) + "Games".rjust(7) +
+          "Win Rate (%)".rjust(14) + "Avg. Score".rjust(12) +
+          "Forfeit".rjust(9) + "Failed Shards".rjust(15))
+    for key, entry in report.items():
+        games = entry["games"]
+        winrate = round(entry["wins"] / games * 100, 2) if games else 0.0
+        avg = round(entry["total"] / games, 2) if games else 0.0
+        print(" " + key.ljust(22) + str(games).rjust(7) +
+              str(winrate).rjust(14) + str(avg).rjust(12) +
+              str(entry["forfeits"]).rjust(9) +
+              str(len(entry["failedShards"])).rjust(15))
+    print()
+    for shard in failed:
+        errors = shard.get("errors") or ["(no error recorded)"]
+        print(" Shard " + shard["id"] + " (" + shard["model"] + "/" +
+              shard["variant"] + ") failed after " +
+              str(shard.get("attempts", 0)) + " attempt(s): " +
+              errors[-1].strip().splitlines()[-1])
+    if failed:
+        print()
+
+
+def startWorker(queue):
+    """Starts a worker process on this machine. Workers run from this file's
+    directory, since the Game classes read their word lists from there.
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    return subprocess.Popen([sys.executable, os.path.abspath(__file__),
+                             "worker", os.path.abspath(queue)], cwd=here)
+
+
+def coordinate(queue, total, timeout=30.0, poll=0.5, localWorkers=None):
+    """Watches a queue until every shard has a result or has failed, then
+    merges them.
+
+    Shards whose workers stop checking in are handed back out (or failed, see
+    reassignStale()). If the
+    coordinator started the workers itself (localWorkers), it also replaces any
+    that die while there's still work to do.
+
+    Returns:
+        The merged report, which is also saved as report.json in the queue.
+    """
+    localWorkers = localWorkers if localWorkers is not None else []
+    try:
+        while finishedCount(queue) < total:
+            reassigned = reassignStale(queue, timeout)
+            if reassigned:
+                print(" Reassigned " + str(reassigned) + " shard(s) from lost"
+                      + " workers.", flush=True)
+            for i, proc in enumerate(localWorkers):
+                if proc.poll() is not None:
+                    print(" Worker " + str(proc.pid) + " exited (" +
+                          str(proc.returncode) + "), starting a new one.",
+                          flush=True)
+                    localWorkers[i] = startWorker(queue)
+            time.sleep(poll)
+    finally:
+        # Tell the workers to go home.
+        with open(queuePath(queue, DONE), "w") as f:
+            f.write("done\n")
+        for proc in localWorkers:
+            proc.wait()
+
+    report = mergeResults(queue)
+    writeJson(queuePath(queue, "report.json"), report)
+    return report
+
+
+def runSharded(queue, solutions, models, variants, shardSize, workers,
+               timeout=30.0, seed=0):
+    """Plans a sweep, runs it on workers started on this machine (standing in
+    for separate nodes), and prints the merged report.
+    """
+    total = planShards(queue, solutions, models, variants, shardSize, seed)
+    print(" Planned " + str(total) + " shards for " + str(workers) +
+          " worker(s).", flush=True)
+    procs = [startWorker(queue) for i in range(workers)]
+    report = coordinate(queue, total, timeout, localWorkers=procs)
+    printReport(report, failedShards(queue))
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Runs simulations sharded across worker processes that "
+                    "share a queue directory.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def addPlanArgs(p):
+        p.add_argument("--iterations", type=int, default=1000,
+                       help="random solutions to play (ignored with --all)")
+        p.add_argument("--all", action="store_true",
+                       help="play every legal solution once")
+        p.add_argument("--models", nargs="+", choices=list(Tournament.MODELS),
+                       default=list(Tournament.MODELS))
+        p.add_argument("--variants", nargs="+", choices=list(VARIANTS),
+                       default=["all"])
+        p.add_argument("--shard-size", type=int, default=100)
+        p.add_argument("--seed", type=int, default=0)
+
+    p = sub.add_parser("plan", help="fill a queue with shards")
+    p.add_argument("queue")
+    addPlanArgs(p)
+    p = sub.add_parser("worker", help="run shards from a queue")
+    p.add_argument("queue")
+    p = sub.add_parser("coordinate", help="watch a planned queue and merge")
+    p.add_argument("queue")
+    p.add_argument("--timeout", type=float, default=30.0)
+    p = sub.add_parser("run", help="plan, run local workers and merge")
+    p.add_argument("queue")
+    p.add_argument("--workers", type=int, default=os.cpu_count())
+    p.add_argument("--timeout", type=float, default=30.0)
+    addPlanArgs(p)
+    args = parser.parse_args()
+
+    def chooseSolutions():
+        if args.all:
+            return list(wss.Game.soln_words)
+        return Tournament.drawSolutions(args.iterations, args.seed)
+
+    if args.command == "plan":
+        print(planShards(args.queue, chooseSolutions(), args.models,
+                         args.variants, args.shard_size, args.seed))
+    elif args.command == "worker":
+        worker(args.queue)
+    elif args.command == "coordinate":
+        total = readJson(queuePath(args.queue, "plan.json"))["shards"]
+        printReport(coordinate(args.queue, total, args.timeout),
+                    failedShards(args.queue))
+    else:
+        runSharded(args.queue, chooseSolutions(), args.models, args.variants,
+                   args.shard_size, args.workers, args.timeout, args.seed)
@@ -0,0 +1,161 @@
+"""The caches the rest of the project shares between players, games and
+threads, so the locking around them is written once.
+
+A SharedCache holds things that are expensive to build and never change once
+they're built (word indexes, scoring engines, feedback tables, opening moves),
+one per key, for as long as the process runs. An LruCache holds things that can
+be rebuilt whenever they're needed again, up to a limit, dropping the least
+recently used ones to make room.
+"""
+import collections
+import threading
+
+
+class SharedCache:
+    """A thread-safe cache of values built once per key and then shared.
+
+    A value is built under the cache's lock, so however many threads ask for
+    it at once, it's only built the once (the rest wait for it). That's the
+    point for the expensive things, like a feedback table that takes seconds
+    to build.
+
+    Keys are normally compared by value. With byIdentity, they're compared by
+    identity instead, for keys that can't be hashed (like plain word lists);
+    the cache keeps hold of the key too, so its id can't be reused by another
+    object while the value is cached.
+    """
+
+    def __init__(self, byIdentity=False):
+        self.byIdentity = byIdentity
+        self.entries = {}
+        self.lock = threading.Lock()
+
+    def _lookup(self, key):
+        # Only call this with the lock held.
+        entry = self.entries.get(id(key) if self.byIdentity else key)
+        if entry is None or (self.byIdentity and entry[0] is not key):
+            return None
+        return entry
+
+    def get(self, key, build):
+        """Returns the value for key, calling build() to make it the first time
+        it's asked for.
+        """
+        with self.lock:
+            entry = self._lookup(key)
+            if entry is None:
+                entry = (key, build())
+                self.entries[id(key) if self.byIdentity else key] = entry
+            return entry[1]
+
+    def peek(self, key):
+        """The value for key if it's already been built, otherwise None."""
+        with self.lock:
+            entry = self._lookup(key)
+            return entry[1] if entry is not None else None
+
+    def clear(self):
+        """Forgets every value, so each will be built again when it's next
+        asked for. Anything already holding one can keep using it.
+        """
+        with self.lock:
+            self.entries.clear()
+
+    def __len__(self):
+        return len(self.entries)
+
+
+class LruCache:
+    """A thread-safe cache of up to capacity worth of values, dropping the
+    least recently used ones to make room.
+
+    Each value counts as size(value) towards the capacity (1 apiece by
+    default, so the capacity is a number of values). Lookups are counted, so
+    the hit rate shows how well the capacity suits the work.
+
+    Attributes:
+        capacity: The most the kept values can add up to.
+        used: What the kept values add up to now.
+        hits: Lookups that found their value.
+        misses: Lookups that didn't.
+        evictions: Values dropped to make room.
+    """
+
+    def __init__(self, capacity, size=None):
+        self.capacity = capacity
+        self.size = size if size is not None else (lambda value: 1)
+        self.values = collections.OrderedDict()
+        self.lock = threading.Lock()
+        self.used = 0
+        self.hits = self.misses = self.evictions = 0
+
+    def get(self, key):
+        """The value for key (now the most recently used), or None."""
+        with self.lock:
+            value = self.values.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self.values.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value, evict=True):
+        """Keeps a value as the most recently used. If there isn't room, the
+        least recently used values are dropped to make some, unless evict is
+        False, in which case the new value just isn't kept. A value bigger than
+        the whole capacity is never kept.
+
+        Returns:
+            True if the value was kept.
+        """
+        size = self.size(value)
+        with self.lock:
+            if key in self.values:
+                self.values.move_to_end(key)
+                return True
+            if size > self.capacity or \
+                    (not evict and self.used + size > self.capacity):
+                return False
+            self.values[key] = value
+            self.used += size
+            while self.used > self.capacity:
+                key, dropped = self.values.popitem(last=False)
+                self.used -= self.size(dropped)
+                self.evictions += 1
+            return True
+
+    def getOrBuild(self, key, build):
+        """Returns the value for key, calling build() to make it (and keeping
+        it) if it isn't there.
+        """
+        value = self.get(key)
+        if value is None:
+            # Built outside the lock so other lookups aren't held up. Two
+            # threads might build the same value at once, but they'll build
+            # the same thing.
+            value = build()
+            self.put(key, value)
+        return value
+
+    def hitRate(self):
+        """The fraction of lookups that found their value."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        """The cache's counters as a dictionary, for reports."""
+        with self.lock:
+            return {"hits": self.hits, "misses": self.misses,
+                    "evictions": self.evictions, "hitRate": self.hitRate(),
+                    "entries": len(self.values), "used": self.used,
+                    "capacity": self.capacity}
+
+    def clear(self):
+        """Drops every value. The counters are kept."""
+        with self.lock:
+            self.values.clear()
+            self.used = 0
+
+    def __len__(self):
+        return len(self.values)
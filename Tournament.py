@@ -0,0 +1,305 @@
+import argparse
+import math
+import random
+import statistics
+
+import Feedback
+import Trace
+import VectorScoring
+import wss
+from WordlePlayer import WordlePlayer
+from WordlePlayerII import WordlePlayerII
+
+
+class WordlePlayerAdapter:
+    """Wraps a WordlePlayer (or any subclass of it) so that it can be driven by
+    the same game loop as the AutoPlayers in wss.py.
+
+    The WordlePlayer family is given its word list up front and plays with
+    takeFeedback() and a no-argument reset(), whereas the AutoPlayers read
+    their lists off of the game and use processFeedback() and reset(game). The
+    adapter translates between the two, and records the guesses and feedback
+    in the trace on the player's behalf.
+    """
+    def __init__(self, player, name):
+        self.player = player
+        self.name = name
+
+    def playWord(self):
+        # A WordlePlayer that has ruled out every word would just fail to pop
+        # from its empty list, so that's turned into the AutoPlayers' way of
+        # giving up.
+        if not self.player.pSpace:
+            raise wss.NoSolutionError(self.name + " says there's no solution.")
+        self.count = len(self.player.pSpace)
+        word = self.player.playWord()
+        if Trace.enabled:
+            Trace.record(Trace.GUESS, self, word, count=self.count)
+        return word
+
+    def processFeedback(self, feedback):
+        if Trace.enabled:
+            Trace.record(Trace.FEEDBACK, self, self.player.playedWords[-1],
+                         Feedback.stringToCode(feedback), count=self.count)
+        # The wss game loop hands over winning feedback too, which the
+        # WordlePlayers were never expected to process.
+        if feedback != "G" * len(feedback):
+            self.player.takeFeedback(feedback)
+
+    def reset(self, game):
+        self.player.reset()
+
+    def __str__(self):
+        return self.name
+
+
+MODELS = {
+    "Mk. I": wss.AutoPlayer_MkI,
+    "Mk. II": wss.AutoPlayer_MkII,
+    "Mk. III": wss.AutoPlayer_MkIII,
+    "Mk. IV": wss.AutoPlayer_MkIV,
+    "Mk. V": wss.AutoPlayer_MkV,
+    "Mk. VI": wss.AutoPlayer_MkVI,
+    "WordlePlayer": lambda game: WordlePlayerAdapter(
+        WordlePlayer(game.words), "WordlePlayer"),
+    "WordlePlayerII": lambda game: WordlePlayerAdapter(
+        WordlePlayerII(game.soln_words), "WordlePlayerII"),
+}
+"""Every player model that can enter a tournament, mapped to a factory that
+builds one from a Game. New models only need an entry here (wrapped in a
+WordlePlayerAdapter if they follow the WordlePlayer interface).
+"""
+if not VectorScoring.available:
+    del MODELS["Mk. V"]     # These need NumPy
+    del MODELS["Mk. VI"]
+
+
+class TournamentGame(wss.Game):
+    """A Game whose feedback is shared between every player in a tournament.
+
+    Every model plays the same solution back to back, and most of them open
+    with the same handful of words, so the feedback for a (guess, solution)
+    pair is worked out once and then looked up for every other model. The cache
+    is keyed by the guess's id (see WordIndex), and is cleared whenever the
+    tournament moves on to a new solution.
+    """
+    def __init__(self, soln=None, config=wss.DEFAULT_CONFIG, rng=None):
+        self.feedbackCache = {}
+        super().__init__(soln, config, rng)
+
+    def newSolution(self):
+        """Moves the tournament on to a new solution, which invalidates all of
+        the feedback worked out for the previous one.
+        """
+        self.feedbackCache.clear()
+
+    def matchWord(self, word):
+        guessId = self.index.idOf(word)     # The word has passed as legal.
+        feedback = self.feedbackCache.get(guessId)
+        if feedback is None:
+            feedback = Feedback.evaluate(word, self.solution)
+            self.feedbackCache[guessId] = feedback
+        self.rounds.append((word, feedback))
+        return feedback
+
+
+def playGame(player, game):
+    """Plays a single game with the wss game loop and returns its score. A
+    player that gives up by raising wss.NoSolutionError (when it thinks it has
+    ruled out every word) is scored as a loss, and the second return value
+    flags that it happened. Any other exception is a bug in the player, and
+    isn't caught.
+    """
+    try:
+        return wss.wordleGameLoop(player, game), False
+    except wss.NoSolutionError:
+        return 0, True
+
+
+def playTimedGame(player, game):
+    """The wss game loop, but timing each of the player's moves (choosing a
+    word and then taking in its feedback). The host's own work isn't counted.
+
+    Returns:
+        The score, whether the player forfeited by raising
+        wss.NoSolutionError, and the list of move times in seconds.
+    """
+    moves = []
+    try:
+        return wss.wordleGameLoop(player, game, moves), False, moves
+    except wss.NoSolutionError:
+        return 0, True, moves
+
+
+def drawSolutions(iterations, seed=None):
+    """Picks the sequence of solutions every model will play. Like
+    runSimulation(), words are drawn at random (with replacement) from the list
+    of legal solutions.
+    """
+    rng = random.Random(seed)
+    return [rng.choice(wss.Game.soln_words) for i in range(iterations)]
+
+
+def playTournament(solutions, models=None, seed=None, progress=False):
+    """Plays every model against every word in solutions, in a single pass.
+
+    For each solution the game is set up once, and then every model plays it in
+    turn, sharing the feedback for any guesses they have in common. Players are
+    built once and reset between games, just as they are in runSimulation().
+
+    Args:
+        solutions: The sequence of solution words to play.
+        models: The names of the models (keys of MODELS) to enter. Defaults to
+          all of them.
+        seed: Seeds the random module before play, so that the models that
+          guess randomly are repeatable too.
+        progress: If True, prints a progress bar like runSimulation() does.
+
+    Returns:
+        A dictionary mapping each model name to its list of scores, in the same
+        order as solutions, and a dictionary mapping each model name to the
+        number of games it forfeited by raising.
+    """
+    models = list(MODELS) if models is None else list(models)
+    if seed is not None:
+        random.seed(seed)
+    game = TournamentGame(solutions[0] if solutions else None)
+    players = {name: MODELS[name](game) for name in models}
+    scores = {name: [] for name in models}
+    errors = {name: 0 for name in models}
+
+    progressChunk = max(1, len(solutions) // 10)
+    if progress:
+        print(" PROG.: ", end="", flush=True)
+    for j, soln in enumerate(solutions):
+        game.newSolution()
+        for name in models:
+            game.reset(soln)
+            players[name].reset(game)
+            score, failed = playGame(players[name], game)
+            scores[name].append(score)
+            errors[name] += 1 if failed else 0
+        if progress and j % progressChunk == progressChunk - 1:
+            print(" X", end="", flush=True)
+    if progress:
+        print()
+    return scores, errors
+
+
+def pairedComparison(scores, baseline, challenger, confidence=0.95):
+    """Compares two models on the games they both played, word for word.
+
+    Because both models played the same solutions, the per-word difference in
+    score cancels out how hard each word was, which is most of the noise in
+    comparing two separate simulations. The interval uses the normal
+    approximation, which is fine for the hundreds of games we play.
+
+    Returns:
+        A dictionary with the mean difference (challenger - baseline), the
+        bounds of its confidence interval, and how many words the challenger
+        did better on, worse on, or tied.
+    """
+    diffs = [c - b for b, c in zip(scores[baseline], scores[challenger])]
+    n = len(diffs)
+    mean = statistics.fmean(diffs) if n else 0.0
+    halfWidth = 0.0
+    if n > 1:
+        z = statistics.NormalDist().inv_cdf(0.5 + confidence / 2)
+        halfWidth = z * statistics.stdev(diffs) / math.sqrt(n)
+    return {
+        "baseline": baseline,
+        "challenger": challenger,
+        "games": n,
+        "meanDiff": mean,
+        "low": mean - halfWidth,
+        "high": mean + halfWidth,
+        "better": sum(1 for d in diffs if d > 0),
+        "worse": sum(1 for d in diffs if d < 0),
+        "tied": sum(1 for d in diffs if d == 0),
+    }
+
+
+def printReport(solutions, scores, errors, baseline, confidence=0.95):
+    """Prints the results of playTournament() in the same format as
+    runSimulation(), followed by each model's paired comparison against the
+    baseline model.
+    """
+    iterations = len(solutions)
+    for name in scores:
+        total_wins = sum(1 for s in scores[name] if s > 0)
+        avg_score = statistics.fmean(scores[name]) if iterations else 0.0
+        avg_of_wins = round(sum(scores[name]) / total_wins, 2) \
+            if total_wins > 0 else 0.0
+        winrate = round(float(total_wins)/float(iterations)*100, 2) \
+            if iterations else 0.0
+        print(" " + name + ": ")
+        print(" ---------------------------")
+        print("         Total Wins: " + str(total_wins))
+        print("       Win Rate (%): " + str(winrate) + "%")
+        print("         Best Score: " + str(max(scores[name], default=0)))
+        print("         Avg. Score: " + str(round(avg_score, 2)))
+        print(" Avg. Score of Wins: " + str(avg_of_wins))
+        if errors[name]:
+            print("          Forfeited: " + str(errors[name]))
+        print()
+
+    print(" PAIRED AGAINST " + baseline + " (" + str(round(confidence*100)) +
+          "% CI on the per-word score difference)")
+    print(" ---------------------------")
+    for name in scores:
+        if name == baseline:
+            continue
+        c = pairedComparison(scores, baseline, name, confidence)
+        print(" " + name.rjust(15) + ": " + format(c["meanDiff"], "+.3f") +
+              "  [" + format(c["low"], "+.3f") + ", " +
+              format(c["high"], "+.3f") + "]  better/worse/tied: " +
+              str(c["better"]) + "/" + str(c["worse"]) + "/" + str(c["tied"]))
+    print()
+
+
+def runTournament(iterations, models=None, baseline=None, seed=None,
+                  confidence=0.95):
+    """Plays a tournament between the given models (all of them by default) on
+    the same randomly chosen solutions, and prints the results.
+    """
+    models = list(MODELS) if models is None else list(models)
+    baseline = baseline if baseline else models[0]
+    if baseline not in models:
+        models.insert(0, baseline)
+    solutions = drawSolutions(iterations, seed)
+
+    print()
+    print(" WORDLE SOLVER TOURNAMENT")
+    print(" ------------------------")
+    print()
+    print(" Every solver plays the same " + str(iterations) + " randomly chosen"
+          + " words, so their scores can be compared word for word.")
+    print()
+    scores, errors = playTournament(solutions, models, seed, progress=True)
+    print()
+    printReport(solutions, scores, errors, baseline, confidence)
+    return scores
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Plays every solver against the same solution words.")
+    parser.add_argument("iterations", type=int, nargs="?", default=100)
+    parser.add_argument("--models", nargs="+", choices=list(MODELS),
+                        help="models to enter (default: all)")
+    parser.add_argument("--baseline", choices=list(MODELS),
+                        help="model the others are compared against")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--confidence", type=float, default=0.95)
+    parser.add_argument("--trace", metavar="PATH",
+                        help="save a trace of the most recent events here "
+                             "(replay it with Trace.py)")
+    parser.add_argument("--trace-capacity", type=int,
+                        default=Trace.DEFAULT_CAPACITY)
+    args = parser.parse_args()
+    if args.trace:
+        Trace.enable(args.trace_capacity)
+    runTournament(args.iterations, args.models, args.baseline, args.seed,
+                  args.confidence)
+    if args.trace:
+        Trace.save(args.trace)
@@ -0,0 +1,204 @@
+import argparse
+import collections
+import itertools
+import math
+import struct
+import threading
+
+import Feedback
+
+GAME_START, GUESS, FEEDBACK, GAME_END = range(4)
+"""The kinds of event a trace records. Every event is a tuple of (kind, game
+number, player name, word, feedback code, candidate count, score):
+
+  - GAME_START: word is the solution.
+  - GUESS: word is the guess, count is how many candidates the player had to
+    choose from and score is the score it gave the guess (where it has them).
+  - FEEDBACK: word is the guess and code its feedback code.
+  - GAME_END: word is the solution and score the player's score for the game.
+
+Each GAME_START takes the next game number, and every event recorded on the
+same thread after it (up to its GAME_END) carries that number, so the events of
+games played at the same time on different threads can be told apart. Events
+recorded outside of a game are numbered 0.
+"""
+NO_COUNT = -1
+NO_SCORE = math.nan
+DEFAULT_CAPACITY = 100000
+
+enabled = False
+"""When False (the default) nothing is traced. Call sites check this before
+calling record(), so a disabled trace costs one attribute lookup and nothing
+gets built for it:
+
+    if Trace.enabled:
+        Trace.record(Trace.GUESS, self, self.choice, count=len(words))
+"""
+echo = False
+"""If True, events are printed as they're recorded, like the old logging."""
+events = collections.deque(maxlen=DEFAULT_CAPACITY)
+"""The ring buffer of recorded events. Once it's full, the oldest events are
+dropped to make room for new ones.
+"""
+
+_names = {}
+_gameNumbers = itertools.count(1)
+_current = threading.local()
+
+
+def enable(capacity=DEFAULT_CAPACITY, echoEvents=False):
+    """Starts tracing into a fresh ring buffer holding the last capacity
+    events.
+    """
+    global enabled, echo, events
+    events = collections.deque(maxlen=capacity)
+    echo = echoEvents
+    enabled = True
+
+
+def disable():
+    """Stops tracing. The events recorded so far are kept."""
+    global enabled
+    enabled = False
+
+
+def nameOf(player):
+    """The name a player is recorded under: its str() if its class has one,
+    otherwise its class name.
+    """
+    cls = type(player)
+    if cls.__str__ is not object.__str__:
+        return str(player)
+    name = _names.get(cls)
+    if name is None:
+        name = _names[cls] = cls.__name__
+    return name
+
+
+def record(kind, player, word, code=0, count=NO_COUNT, score=NO_SCORE):
+    """Records an event in the ring buffer. Only call this when enabled is
+    True.
+    """
+    if kind == GAME_START:
+        _current.game = next(_gameNumbers)
+    game = getattr(_current, "game", 0)
+    if kind == GAME_END:
+        _current.game = 0
+    event = (kind, game, nameOf(player), word, code, count, score)
+    events.append(event)
+    if echo:
+        for line in render(event):
+            print(line)
+
+
+def _guessPrefix(name, count):
+    # The old log lines, up to where the word goes.
+    if count == NO_COUNT:
+        return name + ": Uhhhhh.... is it '"
+    return name + ": I've narrowed it down to " + str(count) + " words..." + \
+        " " * (5 - len(str(count))) + " '"
+
+
+def render(event):
+    """Renders one event as the lines of the old human readable transcript."""
+    kind, game, name, word, code, count, score = event
+    if kind == GAME_START:
+        return ["Game Start (#" + str(game) + ")", "----------",
+                "SOLN: " + word, ""]
+    elif kind == GUESS:
+        line = _guessPrefix(name, count) + word + "'?"
+        if not math.isnan(score):
+            line += "  (score: " + format(score, "g") + ")"
+        return [line]
+    elif kind == FEEDBACK:
+        # Line the feedback up under the guess it's for.
+        indent = len(_guessPrefix(name, count)) - len("Game: ")
+        return [" " * indent + "Game: " + Feedback.codeToString(code,
+                                                                len(word))]
+    elif kind == GAME_END:
+        if score > 0:
+            return ["Victory! " + format(score, "g") + " Points", ""]
+        return ["Defeat! 0 Points (it was '" + word + "')", ""]
+    return []
+
+
+def replay(trace=None, game=None):
+    """Renders a whole trace (the current ring buffer by default) as the old
+    transcript, one line at a time. Each game's events are kept together, in
+    the order their games started, even if the games were played at the same
+    time. Pass a game number to replay just that game.
+    """
+    trace = list(events if trace is None else trace)
+    if game is not None:
+        trace = [event for event in trace if event[1] == game]
+    # A stable sort, so each game's events stay in the order they happened.
+    for event in sorted(trace, key=lambda event: event[1]):
+        yield from render(event)
+
+
+MAGIC = b"WTRC"
+VERSION = 2
+HEADER = struct.Struct("<4sBBHI")
+"""The header of a saved trace: the magic bytes, the format version, the word
+length, the number of player names and the number of events. The header is
+followed by the player names (each a length byte and then the name) and then by
+the events, as fixed-size records.
+"""
+
+
+def _eventStruct(wordLength):
+    return struct.Struct("<BIH" + str(wordLength) + "sHid")
+
+
+def save(path, trace=None):
+    """Writes a trace (the current ring buffer by default) to a binary file."""
+    trace = list(events if trace is None else trace)
+    wordLength = max((len(e[3]) for e in trace), default=5)
+    names = {}
+    for e in trace:
+        names.setdefault(e[2], len(names))
+    packer = _eventStruct(wordLength)
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, wordLength, len(names),
+                            len(trace)))
+        for name in names:
+            encoded = name.encode("utf-8")[:255]
+            f.write(bytes([len(encoded)]) + encoded)
+        for kind, game, name, word, code, count, score in trace:
+            f.write(packer.pack(kind, game, names[name], word.encode("ascii"),
+                                code, count, score))
+
+
+def load(path):
+    """Reads a trace written by save() back into a list of events."""
+    with open(path, "rb") as f:
+        data = f.read()
+    magic, version, wordLength, numNames, numEvents = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(path + " is not a version " + str(VERSION) +
+                         " trace file.")
+    offset = HEADER.size
+    names = []
+    for i in range(numNames):
+        length = data[offset]
+        names.append(data[offset + 1:offset + 1 + length].decode("utf-8"))
+        offset += 1 + length
+    unpacker = _eventStruct(wordLength)
+    trace = []
+    for kind, game, name, word, code, count, score in \
+            unpacker.iter_unpack(data[offset:offset + numEvents *
+                                      unpacker.size]):
+        trace.append((kind, game, names[name],
+                      word.rstrip(b"\0").decode("ascii"), code, count, score))
+    return trace
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Replays a saved trace as a human readable transcript.")
+    parser.add_argument("path")
+    parser.add_argument("--game", type=int,
+                        help="replay only the game with this number")
+    args = parser.parse_args()
+    for line in replay(load(args.path), args.game):
+        print(line)
@@ -0,0 +1,196 @@
+"""Vectorized scoring of every guess in a dictionary, with NumPy.
+
+The players that score words (AutoPlayer_MkIV and WordlePlayerII) build letter
+frequency tables with nested dictionaries and then score the remaining
+candidates one word and one letter at a time. Here the whole dictionary is
+encoded once as an array of letter numbers, so the frequency table and the
+score for every guess come out of a handful of array operations. For the shared
+WordIndex that array is the memory-mapped binary dictionary itself (see
+WordDictionary.py), so every process reads the same pages.
+
+NumPy is optional; everything else in the project runs without it. Check
+available before using this module.
+"""
+import SharedCache
+import WordDictionary
+import WordIndex
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+available = np is not None
+ALPHABET = WordDictionary.ALPHABET
+
+
+def requireNumpy():
+    if not available:
+        raise ImportError("Vectorized scoring needs NumPy (pip install numpy)")
+
+
+def encodeWords(words):
+    """Encodes a list of equal length lowercase words as a (words x letters)
+    array of letter numbers, 0 for 'a' through 25 for 'z'.
+    """
+    requireNumpy()
+    if not words:
+        return np.zeros((0, 0), dtype=np.uint8)
+    data = np.frombuffer("".join(words).encode("ascii"), dtype=np.uint8)
+    return (data - ord("a")).reshape(len(words), len(words[0]))
+
+
+def mappedWords(dictionary):
+    """The encoded words of a WordDictionary.MappedDictionary, laid out like
+    encodeWords() lays them out, as a read-only array over the mapping rather
+    than a copy of it.
+    """
+    requireNumpy()
+    return np.frombuffer(dictionary.letters, dtype=np.uint8).reshape(
+        dictionary.numWords, dictionary.wordLength)
+
+
+def positionalFrequency(engine, candidates):
+    """The AutoPlayer_MkIV score: for each letter of a guess, the number of
+    candidates with the same letter in the same position.
+    """
+    counts = engine.positionCounts(candidates)
+    return counts[engine.positions, engine.matrix].sum(axis=1)
+
+
+def letterFrequency(engine, candidates):
+    """For each distinct letter of a guess, the number of candidates that have
+    that letter anywhere. Repeated letters only count once, so this favours
+    guesses that try out as many common letters as possible.
+    """
+    counts = engine.presence[candidates].sum(axis=0, dtype=np.int64)
+    return engine.presence.astype(np.int64) @ counts
+
+
+def combinedFrequency(engine, candidates):
+    """The positional score plus the letter score, so a guess gets credit both
+    for placing letters well and for covering a lot of them.
+    """
+    return positionalFrequency(engine, candidates) + \
+        letterFrequency(engine, candidates)
+
+
+SCORING_FUNCTIONS = {
+    "positional": positionalFrequency,
+    "letters": letterFrequency,
+    "combined": combinedFrequency,
+}
+"""The built in scoring functions by name. A scoring function takes a
+ScoringEngine and an array of candidate indices, and returns an array with a
+score for every word in the engine's dictionary (higher is better).
+"""
+
+
+class ScoringEngine:
+    """Scores every word in a dictionary against a set of candidates at once.
+
+    Attributes:
+        words: The dictionary.
+        index: Maps each word to its row in the arrays below (its id, when
+          the engine is built from a WordIndex).
+        matrix: The encoded dictionary, one row of letter numbers per word
+          (over the mapped dictionary if the WordIndex was loaded from one).
+        presence: A (words x 26) boolean array of which letters each word has.
+        positions: The column numbers, shaped to index the frequency table
+          alongside matrix.
+        scoringFunction: The function used by score() when it isn't given one.
+    """
+
+    def __init__(self, words, scoringFunction=positionalFrequency):
+        """Takes the dictionary as a WordIndex (whose ids then double as the
+        rows of the arrays) or as a plain list of words.
+        """
+        requireNumpy()
+        dictionary = None
+        if isinstance(words, WordIndex.WordIndex):
+            self.words = words.words
+            self.index = words.ids
+            dictionary = words.dictionary
+        else:
+            self.words = words
+            self.index = {word: i for i, word in enumerate(words)}
+        words = self.words
+        self.matrix = mappedWords(dictionary) if dictionary is not None \
+            else encodeWords(words)
+        length = self.matrix.shape[1] if self.matrix.size else 0
+        self.presence = np.zeros((len(words), len(ALPHABET)), dtype=bool)
+        rows = np.repeat(np.arange(len(words)), length)
+        self.presence[rows, self.matrix.ravel()] = True
+        self.positions = np.arange(length)[np.newaxis, :]
+        # Engines are shared between players (and threads), so the arrays are
+        # frozen once they're built.
+        for array in (self.matrix, self.presence, self.positions):
+            array.flags.writeable = False
+        if isinstance(scoringFunction, str):
+            scoringFunction = SCORING_FUNCTIONS[scoringFunction]
+        self.scoringFunction = scoringFunction
+
+    def indicesOf(self, words):
+        """Converts a list of words from the dictionary into an index array."""
+        return np.fromiter((self.index[word] for word in words),
+                           dtype=np.intp, count=len(words))
+
+    def positionCounts(self, candidates):
+        """The (letters x 26) table of how many candidates have each letter in
+        each position.
+        """
+        length = self.matrix.shape[1]
+        counts = np.zeros((length, len(ALPHABET)), dtype=np.int64)
+        for i in range(length):
+            counts[i] = np.bincount(self.matrix[candidates, i],
+                                    minlength=len(ALPHABET))
+        return counts
+
+    def score(self, candidates, scoringFunction=None):
+        """Scores every word in the dictionary against the candidates (an
+        index array, or a list of words from the dictionary).
+
+        Returns:
+            An array with one score per word in the dictionary.
+        """
+        if not isinstance(candidates, np.ndarray):
+            candidates = self.indicesOf(candidates)
+        scoringFunction = scoringFunction or self.scoringFunction
+        if isinstance(scoringFunction, str):
+            scoringFunction = SCORING_FUNCTIONS[scoringFunction]
+        return scoringFunction(self, candidates)
+
+    def best(self, candidates, scoringFunction=None, preferCandidates=True):
+        """Returns the highest scoring word in the whole dictionary. On a tie,
+        a word that could still be the answer wins (if preferCandidates), and
+        then whichever comes first in the dictionary.
+        """
+        return self.bestScored(candidates, scoringFunction,
+                               preferCandidates)[0]
+
+    def bestScored(self, candidates, scoringFunction=None,
+                   preferCandidates=True):
+        """The same as best(), but returns a (word, score) pair."""
+        if not isinstance(candidates, np.ndarray):
+            candidates = self.indicesOf(candidates)
+        scores = self.score(candidates, scoringFunction)
+        top = scores.max()
+        tied = np.flatnonzero(scores == top)
+        if preferCandidates:
+            tiedCandidates = np.intersect1d(tied, candidates)
+            if tiedCandidates.size:
+                return self.words[tiedCandidates[0]], top.item()
+        return self.words[tied[0]], top.item()
+
+
+engines = SharedCache.SharedCache(byIdentity=True)
+"""This process's scoring engines, by word list or WordIndex."""
+
+
+def engineFor(words):
+    """Returns a shared ScoringEngine for a word list or WordIndex, so every
+    player using the same one (the Game's index, usually) shares one encoding.
+    Players that want a different scoring function pass it to score() or
+    best().
+    """
+    return engines.get(words, lambda: ScoringEngine(words))
@@ -0,0 +1,210 @@
+import argparse
+import mmap
+import os
+import struct
+
+DEFAULT_WORDS = "all.txt"
+DEFAULT_SOLNS = "actual.txt"
+DEFAULT_BINARY = "words.bin"
+
+MAGIC = b"WDIC"
+VERSION = 2
+HEADER = struct.Struct("<4sHHII")
+"""The header of a binary dictionary: the magic bytes, the format version, the
+length of every word, the number of guess words and the number of solutions.
+
+The header is followed by the guess words, packed back to back in their
+original order with each letter stored as its letter number (0 for 'a' through
+25 for 'z', the encoding VectorScoring works in), and then by the solutions,
+stored as little-endian uint32 indices into the guess words. Because every
+record is a fixed width, any word can be found by offset without parsing
+anything, and the letters can be used in place as a (words x letters) array.
+"""
+INDEX = struct.Struct("<I")
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+ENCODE = bytes.maketrans(ALPHABET.encode("ascii"), bytes(range(26)))
+DECODE = bytes.maketrans(bytes(range(26)), ALPHABET.encode("ascii"))
+
+
+def readWordList(path):
+    """Reads one of the plain text word lists (one word per line) into a list,
+    stripping the newlines the same way the Game classes always have.
+    """
+    words = []
+    with open(path, "r") as f:
+        for word in f:
+            word = word.strip()
+            if word:
+                words.append(word)
+    return words
+
+
+def convert(wordsPath=DEFAULT_WORDS, solnsPath=DEFAULT_SOLNS,
+            outPath=DEFAULT_BINARY):
+    """Converts the text lists of guesses and solutions into a binary
+    dictionary at outPath.
+
+    Raises:
+        ValueError: If the words aren't all the same length or aren't all
+          lowercase letters, or a solution is missing from the guess list.
+    """
+    words = readWordList(wordsPath)
+    solns = readWordList(solnsPath)
+    wordLength = len(words[0]) if words else 0
+    if any(len(word) != wordLength for word in words):
+        raise ValueError("Every word in " + wordsPath + " must be " +
+                         str(wordLength) + " letters long.")
+    positions = {word: i for i, word in enumerate(words)}
+    missing = [word for word in solns if word not in positions]
+    if missing:
+        raise ValueError("Solutions missing from " + wordsPath + ": " +
+                         ", ".join(missing[:10]))
+    letters = "".join(words)
+    if letters.strip(ALPHABET):
+        raise ValueError("Every word in " + wordsPath + " must be lowercase "
+                         "letters.")
+
+    # Write to a temporary file of our own and move it into place, so a worker
+    # that maps the dictionary while it's being rebuilt (or is rebuilding it
+    # too) never sees half a file.
+    tmpPath = outPath + "." + str(os.getpid()) + ".tmp"
+    try:
+        with open(tmpPath, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, wordLength, len(words),
+                                len(solns)))
+            f.write(letters.encode("ascii").translate(ENCODE))
+            f.write(b"".join(INDEX.pack(positions[word]) for word in solns))
+        os.replace(tmpPath, outPath)
+    finally:
+        if os.path.exists(tmpPath):
+            os.remove(tmpPath)
+
+
+class MappedDictionary:
+    """A binary dictionary, memory-mapped read-only.
+
+    Mapping the file means a word can be read from anywhere in it without
+    reading the rest, and every process that maps the same file shares the
+    same pages of it. The WordIndex loaded from a dictionary keeps it open, so
+    the scoring engine's encoded words (see VectorScoring.mappedWords()), which
+    everything that scores guesses or builds feedback rows reads, are the
+    mapped letters themselves rather than a copy per process.
+
+    Attributes:
+        wordLength: The length of every word in the dictionary.
+        numWords: The number of guess words.
+        numSolns: The number of solution words.
+        letters: A read-only view of every guess word's letter numbers, back
+          to back, straight out of the mapping.
+        solnIndices: The solutions as indices into the guess words, read
+          straight out of the mapping.
+    """
+
+    def __init__(self, path=DEFAULT_BINARY):
+        with open(path, "rb") as f:
+            self.buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.wordLength, self.numWords, self.numSolns = \
+            HEADER.unpack_from(self.buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            self.buffer.close()
+            raise ValueError(path + " is not a version " + str(VERSION) +
+                             " binary dictionary.")
+        self.wordsOffset = HEADER.size
+        self.solnsOffset = self.wordsOffset + self.numWords * self.wordLength
+        end = self.solnsOffset + self.numSolns * INDEX.size
+        if len(self.buffer) < end:
+            self.buffer.close()
+            raise ValueError(path + " is truncated.")
+        self.letters = memoryview(self.buffer)[self.wordsOffset:
+                                               self.solnsOffset]
+        if INDEX.pack(1) == struct.pack("=I", 1):
+            self.solnIndices = memoryview(self.buffer)[self.solnsOffset:end]\
+                .cast("I")
+        else:
+            # The file is little-endian; only decode it by hand on the rare
+            # machine that isn't.
+            self.solnIndices = [INDEX.unpack_from(self.buffer, self.solnsOffset
+                                + i * INDEX.size)[0]
+                                for i in range(self.numSolns)]
+
+    def wordAt(self, index):
+        """Returns the guess word at the given index."""
+        if not 0 <= index < self.numWords:
+            raise IndexError("word index out of range")
+        start = self.wordsOffset + index * self.wordLength
+        return self.buffer[start:start + self.wordLength].translate(DECODE)\
+            .decode("ascii")
+
+    def solnAt(self, index):
+        """Returns the solution word at the given index of the solution list."""
+        return self.wordAt(self.solnIndices[index])
+
+    def wordList(self):
+        """Decodes every guess word into a list, in their original order."""
+        data = self.letters.tobytes().translate(DECODE).decode("ascii")
+        n = self.wordLength
+        return [data[i:i + n] for i in range(0, len(data), n)]
+
+    def solnList(self, words=None):
+        """Builds the list of solution words, in their original order. Pass in
+        the result of wordList() if you already have it to save decoding the
+        words again.
+        """
+        if words is None:
+            return [self.wordAt(i) for i in self.solnIndices]
+        return [words[i] for i in self.solnIndices]
+
+    def close(self):
+        """Unmaps the file. Nothing read from the dictionary can be used
+        afterwards except the lists from wordList() and solnList().
+
+        Raises:
+            BufferError: If an array still points into the mapping (like a
+              scoring engine's words); drop those first.
+        """
+        if isinstance(self.solnIndices, memoryview):
+            self.solnIndices.release()
+        self.letters.release()
+        self.buffer.close()
+
+    def __len__(self):
+        return self.numWords
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def isCurrent(binaryPath=DEFAULT_BINARY, wordsPath=DEFAULT_WORDS,
+              solnsPath=DEFAULT_SOLNS):
+    """True if the binary dictionary exists, is in this version of the format
+    and is newer than both of the text lists it was built from.
+    """
+    try:
+        built = os.path.getmtime(binaryPath)
+        with open(binaryPath, "rb") as f:
+            header = f.read(HEADER.size)
+        return len(header) == HEADER.size and \
+            HEADER.unpack(header)[:2] == (MAGIC, VERSION) and \
+            built >= os.path.getmtime(wordsPath) and \
+            built >= os.path.getmtime(solnsPath)
+    except OSError:
+        return False
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Converts the text word lists into a binary dictionary. "
+                    "WordIndex.sharedIndex() does this by itself when the "
+                    "dictionary is missing or out of date.")
+    parser.add_argument("--words", default=DEFAULT_WORDS)
+    parser.add_argument("--solns", default=DEFAULT_SOLNS)
+    parser.add_argument("--out", default=DEFAULT_BINARY)
+    args = parser.parse_args()
+    convert(args.words, args.solns, args.out)
+    dictionary = MappedDictionary(args.out)
+    print("Wrote " + str(dictionary.numWords) + " words and " +
+          str(dictionary.numSolns) + " solutions to " + args.out)
+    dictionary.close()
@@ -0,0 +1,121 @@
+import types
+
+import SharedCache
+import WordDictionary
+
+
+class WordIndex:
+    """A hashed index over the guess and solution lists.
+
+    Every guess word gets a stable integer id (its position in the guess
+    list), and the solution list is kept as ids too, so anything that wants to
+    key a table by word can use small integers instead of hashing strings, and
+    a solution can be found in the guess list (or vice versa) without
+    searching.
+
+    An index is shared by every game and player in the process, possibly
+    across threads, so nothing in it can be changed once it's built: the lists
+    are tuples and the maps are read-only views.
+
+    Attributes:
+        words: The guess words, as a tuple; words[id] is the word with that id.
+        ids: Maps each guess word to its id.
+        solnIds: The solution list, as a tuple of ids, in its original order.
+        solnWords: The solution list, as a tuple of words.
+        solnPositions: Maps the id of each solution to its position in the
+          solution list.
+        dictionary: The WordDictionary.MappedDictionary the index was loaded
+          from, kept open so the encoded words can be read from the mapping
+          (see VectorScoring.mappedWords()), or None.
+    """
+
+    def __init__(self, words, solnIds, dictionary=None):
+        """Builds the index from the guess words and the ids of the solutions.
+        Use fromLists() if the solutions are words rather than ids.
+        """
+        self.dictionary = dictionary
+        self.words = tuple(words)
+        self.ids = types.MappingProxyType(
+            {word: i for i, word in enumerate(self.words)})
+        self.solnIds = tuple(solnIds)
+        self.solnWords = tuple(self.words[i] for i in self.solnIds)
+        self.solnPositions = types.MappingProxyType(
+            {id: i for i, id in enumerate(self.solnIds)})
+
+    @classmethod
+    def fromLists(cls, words, solns):
+        """Builds the index from a guess list and a solution list of words.
+
+        Raises:
+            ValueError: If a solution isn't in the guess list.
+        """
+        ids = {word: i for i, word in enumerate(words)}
+        missing = [word for word in solns if word not in ids]
+        if missing:
+            raise ValueError("Solutions missing from the guess list: " +
+                             ", ".join(missing[:10]))
+        return cls(words, [ids[word] for word in solns])
+
+    @classmethod
+    def fromDictionary(cls, dictionary):
+        """Builds the index from a WordDictionary.MappedDictionary, which
+        already stores the solutions as ids. The index keeps the dictionary
+        open, for whatever wants to read the words from the mapping.
+        """
+        return cls(dictionary.wordList(), dictionary.solnIndices, dictionary)
+
+    def __contains__(self, word):
+        """True if word is a legal guess."""
+        return word in self.ids
+
+    def __len__(self):
+        return len(self.words)
+
+    def idOf(self, word):
+        """The id of a legal guess. Raises KeyError for anything else."""
+        return self.ids[word]
+
+    def wordOf(self, id):
+        """The word with the given id."""
+        return self.words[id]
+
+    def idsOf(self, words):
+        """The ids of a list of legal guesses, as a list."""
+        ids = self.ids
+        return [ids[word] for word in words]
+
+    def isSolution(self, id):
+        """True if the word with the given id can be a solution."""
+        return id in self.solnPositions
+
+
+_shared = SharedCache.SharedCache()
+
+
+def sharedIndex(wordsPath=WordDictionary.DEFAULT_WORDS,
+                solnsPath=WordDictionary.DEFAULT_SOLNS,
+                binaryPath=WordDictionary.DEFAULT_BINARY):
+    """Returns the index for the given word lists, building it the first time
+    it's asked for so every game and player in the process shares one.
+
+    The index comes from the binary dictionary (see WordDictionary.py), which
+    is built from the text lists first if it's missing or older than them, so
+    every process using the same lists maps the same file and shares its
+    pages. If it can't be written (say the directory is read-only), the index
+    is loaded from the text lists instead.
+    """
+    return _shared.get((wordsPath, solnsPath, binaryPath),
+                       lambda: _loadIndex(wordsPath, solnsPath, binaryPath))
+
+
+def _loadIndex(wordsPath, solnsPath, binaryPath):
+    if not WordDictionary.isCurrent(binaryPath, wordsPath, solnsPath):
+        try:
+            WordDictionary.convert(wordsPath, solnsPath, binaryPath)
+        except (OSError, ValueError):
+            # fromLists() raises the same complaint about a missing solution,
+            # and there's nothing wrong with lists the format just can't hold.
+            return WordIndex.fromLists(WordDictionary.readWordList(wordsPath),
+                                       WordDictionary.readWordList(solnsPath))
+    return WordIndex.fromDictionary(
+        WordDictionary.MappedDictionary(binaryPath))
@@ -13,7 +13,8 @@ class WordlePlayer:
           possible answers, but can include more. No implementation should alter
           this list directly, as the base class assumes it's always complete. It
           is assumed that the length of every word in the list is a uniform 
-          length.
+          length. It can be a tuple (the games share theirs as tuples, so that
+          nothing can alter them).
         alphabet: A hard-coded list of all letters in lower case. This should 
           also never be tampered with as it's used in reset() to establish the
           knowledge dictionary. 
@@ -62,9 +63,10 @@ class WordlePlayer:
         """Resets the state of the WordlePlayer so they can begin a new game. 
         
         The following attributes are set to their default states: pSpace 
-        (defaults to a copy of wordList), playedWords, feedback, and knowledge.
+        (defaults to a list copy of wordList), playedWords, feedback, and 
+        knowledge.
         """
-        self.pSpace = self.wordList.copy()
+        self.pSpace = list(self.wordList)
         self.playedWords = []
         self.feedback = []
         self.knowledge = {x: [[], [False]] for x in self.alphabet}
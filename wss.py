@@ -1,39 +1,66 @@
+import collections
+import concurrent.futures
 import io
+import os
 import random
-
-loggingEnabled = False
-"""Some AutoPlayers print more out to the console for the program user to follow 
-their logic, but this is mostly for debugging. 
-"""
-useSolns = False    
-"""If True, solvers will use the list of actual solution words to do any 
-decision making. This increases their effectiveness by vastly limiting the 
-possibility space. While this is more in line with the fuzzy concept of "words a
-person would actually guess", it is perhaps an overcorrection, as a layperson
-wouldn't have access such a tight dictionary. 
+import time
+
+import Feedback
+import MoveSelection
+import SharedCache
+import Trace
+import VectorScoring
+import WordIndex
+
+GameConfig = collections.namedtuple("GameConfig", ["useSolns", "logging"])
+"""The settings for a game, handed to each Game rather than kept in globals so 
+that games with different settings can run side by side (on different threads,
+even). It's a namedtuple, so it can't be changed once a game has it; use 
+_replace() to make a variant. 
+
+  - useSolns: If True, solvers will use the list of actual solution words to do
+    any decision making. This increases their effectiveness by vastly limiting
+    the possibility space. While this is more in line with the fuzzy concept of
+    "words a person would actually guess", it is perhaps an overcorrection, as 
+    a layperson wouldn't have access such a tight dictionary. 
+  - logging: If True, the Game prints a summary of its rounds when it's reset,
+    mostly for debugging. The AutoPlayers' play-by-play goes through Trace 
+    instead; use Trace.enable(echoEvents=True) to follow their logic on the 
+    console. 
 """
+DEFAULT_CONFIG = GameConfig(useSolns=False, logging=False)
 
-def log(message):
-    if loggingEnabled:
-        print(message)
+class NoSolutionError(Exception):
+    """Raised by a player that has ruled out every word, so it has nothing left
+    to guess. Hosts that play lots of games (like the tournament) count it as 
+    a forfeit; anything else a player raises is a bug, and isn't caught. 
+    """
 
 class Game:
     """Stores the game-state information for an instance of a Wordle Game, as 
     well as the lists of all possible words and all words elligible to be 
     solutions. 
     """
-    words = []                      # List of all valid guesses
-    soln_words = []                 # List of guesses that can be solutions
-    with open("all.txt", "r") as f:
-        for word in f:
-            words.append(word[:5])          # Strip the newlines
-    with open("actual.txt", "r") as f:
-        for word in f:
-            soln_words.append(word[:5])     # Strip the newlines
+    # The shared index of every valid guess and the guesses that can be 
+    # solutions (see WordIndex.py), and the same two lists. The index comes 
+    # from the binary dictionary if it's been built, otherwise from the text
+    # files. Every game shares these, so they're tuples: players that want to
+    # whittle a list down have to take their own copy. 
+    index = WordIndex.sharedIndex()
+    words = index.words             # All valid guesses
+    soln_words = index.solnWords    # Guesses that can be solutions
     
-    def __init__(self, soln=None):
+    def __init__(self, soln=None, config=DEFAULT_CONFIG, rng=None):
         """Initializes a game by running it's reset() function. 
+
+        The config is the GameConfig the game and its players go by. The rng is
+        the random number generator used to pick solutions, and by players 
+        that guess at random. It defaults to the random module's shared one; 
+        give each game its own random.Random if games are played on several 
+        threads at once and need to be repeatable. 
         """
+        self.config = config
+        self.rng = rng if rng is not None else random
         self.reset(soln)
 
     def reset(self, soln=None):
@@ -42,7 +69,7 @@ class Game:
         that is the solution, otherwise it picks randomly from the legal 
         solutions list.
         """
-        if loggingEnabled:
+        if self.config.logging:
             try:
                 if self.solution != None:
                     print("---")
@@ -56,7 +83,7 @@ class Game:
                 print(fdbckln)
             except:
                 itsfinejustkeepgoing = True
-        self.solution = soln if soln else random.choice(self.soln_words)
+        self.solution = soln if soln else self.rng.choice(self.soln_words)
         self.rounds = []
 
     def isOver(self):
@@ -79,11 +106,11 @@ class Game:
         isn't in the word list; if they're a Human, for instance. The logic can
         be revisited if classes are ever created that can guess illegal words, 
         but for now if the player is not an instance of the HumanPlayer class
-        we can short circuit this check, as I'm sure it's not helping 
-        performance.  
+        we can short circuit this check. (It's a hash lookup in the index now,
+        so it isn't hurting performance much either way.)
         """
         if isinstance(player, HumanPlayer):
-            return word in self.words
+            return word in self.index
         else:
             return True
 
@@ -118,41 +145,12 @@ class Game:
         
         The key is outlined in the comment of the tryRound method. 
         """
-        # Approach: Keep track of letters that are matched; removing them from
-        # consideration so that double-matching for any reason is impossible. 
-        # We do two passes for reasons (explained later) so we want to be able
-        # to edit the working values of the words on the fly. Lists of chars was
-        # more easy to do that with right away than to edit strings (I'm new).
-        wordUnchecked = [word[0], word[1], word[2], word[3], word[4]]
-        solnUnchecked = [self.solution[0], self.solution[1], self.solution[2], 
-                     self.solution[3], self.solution[4]]
-        output = ["_","_","_","_","_"] # Defaults to unmatched
-    
-        # Do an inital pass to avoid jumping the gun; when multiple matches are
-        # possible, exact matches take priority and should exclude the inexact
-        # variant matches from happening.    
-        for i in range(5):
-            if wordUnchecked[i] == solnUnchecked[i]:
-                output[i] = "G"
-                # '.' is sentinel below to skip that index
-                wordUnchecked[i] = "."
-                solnUnchecked[i] = "."
-
-        # Exact matches are no longer in the set, so inexact matches are all 
-        # that's left
-        for i in range(5):
-            if wordUnchecked[i] == ".": 
-                continue
-            elif wordUnchecked[i] in solnUnchecked:
-                # Match to the first unchecked occurence in the word, then
-                # don't match to that occurence again. 
-                solnUnchecked.remove(wordUnchecked[i])
-                output[i] = "Y"
+        feedback = Feedback.evaluate(word, self.solution)
 
         # At this point, the word has been checked. Log the results for future
         # reference:
-        self.rounds.append((word, str.join("", output)))
-        return str.join("", output)
+        self.rounds.append((word, feedback))
+        return feedback
 
 class HumanPlayer:
     """Player control logic for a human being to provide input through the 
@@ -201,14 +199,17 @@ class AutoPlayer_MkI:
 
     def playWord(self):
         """Grabs a random word from the list of all possible words"""
-        choice = random.choice(self.game.words)
-        log(str(self) + ": Uhhhhh.... is it '" + choice + "'?")
-        return random.choice(self.game.words)
+        choice = self.game.rng.choice(self.game.words)
+        if Trace.enabled:
+            Trace.record(Trace.GUESS, self, choice)
+        return choice
 
     def processFeedback(self, feedback):
         """Like any good dumb player, the MkI ignores all feedback. 
         """
-        log("               Game:                   " + feedback)
+        if Trace.enabled:
+            Trace.record(Trace.FEEDBACK, self, self.game.rounds[-1][0],
+                         Feedback.stringToCode(feedback))
         self.ignoreFeedback = True
 
     def reset(self, game):
@@ -240,8 +241,8 @@ class AutoPlayer_MkII:
         """
         # Initialize references to the game being played. 
         self.game = game
-        self.possibilities = self.game.soln_words.copy() if useSolns else \
-            self.game.words.copy()
+        self.possibilities = list(self.game.soln_words) if \
+            self.game.config.useSolns else list(self.game.words)
 
         # Set up the knowledge base of letters in the final answer that we're 
         # certain about the position of, letters in the answer we're uncertain
@@ -258,20 +259,20 @@ class AutoPlayer_MkII:
         """Grabs a random word from its local list of remaining possible words.
         Inelligible words are excluded in the feedback step after each round. 
         """
-        self.choice = random.choice(self.possibilities)
-        # Formatting for the console with nasty string concatenation
-        log(str(self) + ": I've narrowed it down to " + 
-            str(len(self.possibilities)) + " words..." + " " * 
-            (5-len(str(len(self.possibilities)))) + " '" + self.choice + "'?")
+        self.choice = self.game.rng.choice(self.possibilities)
+        if Trace.enabled:
+            Trace.record(Trace.GUESS, self, self.choice,
+                         count=len(self.possibilities))
         return self.choice
 
     def processFeedback(self, feedback):
         """Uses the feedback to expand its knowledge base, and then uses that
         base to pare down the possibility space. 
         """
-        # Nasty string concatenation
-        log("                Game:                                          " 
-            + feedback)
+        if Trace.enabled:
+            Trace.record(Trace.FEEDBACK, self, self.choice,
+                         Feedback.stringToCode(feedback),
+                         count=len(self.possibilities))
 
         # We won! No need to iterate again :)
         if feedback == "GGGGG":
@@ -366,7 +367,7 @@ class AutoPlayer_MkII:
                 keep.append(testWord)
         self.possibilities = keep
         if len(keep) == 0:
-            raise Exception("AutoPlayer_MkII says there's no solution.")
+            raise NoSolutionError("AutoPlayer_MkII says there's no solution.")
 
     def __str__(self):
         return "AutoPlayer (Mark II)"
@@ -388,12 +389,17 @@ class AutoPlayer_MkIII(AutoPlayer_MkII):
         """
         if len(self.game.rounds) == 0:
             self.choice = "caret"
-            return self.choice
         elif len(self.game.rounds) == 1:
             self.choice = "loins"
-            return self.choice
         else:
             return super().playWord()
+        if Trace.enabled:
+            Trace.record(Trace.GUESS, self, self.choice,
+                         count=len(self.possibilities))
+        return self.choice
+
+    def __str__(self):
+        return "AutoPlayer (Mark III)"
 
 class AutoPlayer_MkIV(AutoPlayer_MkII):
     """Player control logic for a computer that analyzes word dictionaries to 
@@ -412,6 +418,10 @@ class AutoPlayer_MkIV(AutoPlayer_MkII):
         the most effective choice.
         """
         self.choice = self.possibilities[0]
+        if Trace.enabled:
+            Trace.record(Trace.GUESS, self, self.choice,
+                         count=len(self.possibilities),
+                         score=self.word_scores[self.choice])
         return self.choice
 
     def processFeedback(self, feedback):
@@ -443,7 +453,7 @@ class AutoPlayer_MkIV(AutoPlayer_MkII):
         ## Outputs Findings as CSV text to the console.
         ## Mapping has since been updated, so it won't work, but because I'm 
         ## updating it I might need to revisit a debugging solution. 
-        #if loggingEnabled:
+        #if self.game.config.logging:
         #    for letter in lft.keys():
         #        letter_all = 0
         #        letter_soln = 0
@@ -491,27 +501,210 @@ class AutoPlayer_MkIV(AutoPlayer_MkII):
         possibility space.
         """
         return self.word_scores[word]
+
+    def __str__(self):
+        return "AutoPlayer (Mark IV)"
+
+class AutoPlayer_MkV:
+    """Player control logic for a computer that scores the whole dictionary 
+    every round, not just the words that could still be the answer. 
+
+    The scoring is the same idea as the Mk IV's (how much a word has in common
+    with the remaining possibilities), but it's done for every legal guess at 
+    once with NumPy (see VectorScoring.py), so a word that can't be the answer 
+    but would tell us a lot can still be played. By default it scores both 
+    placing letters and covering them, which beat the Mk IV's positional score
+    alone in a tournament. Once the possibilities are down to two there's 
+    nothing left to learn, so it just guesses one. 
+    """
+    # (word index, useSolns, scoring function) -> (guess id, score)
+    openingChoices = SharedCache.SharedCache()
+
+    def __init__(self, game, scoringFunction="combined"):
+        """Takes the name of a scoring function from VectorScoring (or a 
+        scoring function itself) to score the dictionary with.
+        """
+        VectorScoring.requireNumpy()
+        self.scoringFunction = scoringFunction
+        self.reset(game)
+
+    def reset(self, game):
+        """Sets up the player to play a new game. The possibilities list is 
+        only ever replaced, never edited, so it can start as the game's own.
+        """
+        self.game = game
+        self.engine = VectorScoring.engineFor(self.game.index)
+        self.possibilities = self.game.soln_words if \
+            self.game.config.useSolns else self.game.words
+
+    def playWord(self):
+        """Plays the best scoring word in the dictionary. The first guess is 
+        always the same, so it's only worked out once.
+        """
+        score = Trace.NO_SCORE
+        if len(self.possibilities) <= 2:
+            self.choice = self.possibilities[0]
+        elif len(self.game.rounds) == 0:
+            index = self.game.index
+            key = (index, self.game.config.useSolns, str(self.scoringFunction))
+            opening = self.openingChoices.get(key, self.openingChoice)
+            self.choice, score = index.wordOf(opening[0]), opening[1]
+        else:
+            self.choice, score = self.engine.bestScored(self.possibilities, 
+                                                        self.scoringFunction)
+        if Trace.enabled:
+            Trace.record(Trace.GUESS, self, self.choice,
+                         count=len(self.possibilities), score=score)
+        return self.choice
+
+    def openingChoice(self):
+        """Works out the first guess, as a (guess id, score) pair."""
+        word, score = self.engine.bestScored(self.possibilities, 
+                                             self.scoringFunction)
+        return self.game.index.idOf(word), score
+
+    def processFeedback(self, feedback):
+        """Keeps only the possibilities that would have given exactly this 
+        feedback. 
+        """
+        if Trace.enabled:
+            Trace.record(Trace.FEEDBACK, self, self.choice,
+                         Feedback.stringToCode(feedback),
+                         count=len(self.possibilities))
+        if feedback == "G" * len(feedback):
+            return
+        code = Feedback.stringToCode(feedback)
+        self.possibilities = Feedback.partition(self.choice, 
+                                                self.possibilities).get(code, [])
+        if len(self.possibilities) == 0:
+            raise NoSolutionError("AutoPlayer_MkV says there's no solution.")
+
+    def __str__(self):
+        return "AutoPlayer (Mark V)"
+
+class AutoPlayer_MkVI:
+    """Player control logic for a computer that looks ahead. Every round it 
+    plays whichever legal guess would leave the fewest possibilities on 
+    average, going by how the guess would split up the ones that are left.
+
+    That takes the feedback for every guess against every possibility, every 
+    round, so it's read from a table that's only worked out once (see 
+    FeedbackTable.py), and choosing the move is left to a selector from 
+    MoveSelection.py. By default the moves are chosen in this process; pass a
+    MoveSelection.ParallelMoveSelector (built over the game's index) to share 
+    each move out between worker processes instead, or a MoveSelector with a 
+    maxBytes cap to keep the table's memory down. 
+
+    The table only covers the solution list, so the Mk VI always takes the 
+    possibilities to be the solution words, whatever the game's config says. 
+    """
+    # word index -> (first guess id, score)
+    openingChoices = SharedCache.SharedCache()
+
+    def __init__(self, game, selector=None):
+        VectorScoring.requireNumpy()
+        self.selector = selector if selector is not None else \
+            MoveSelection.MoveSelector(game.index)
+        self.reset(game)
+
+    def reset(self, game):
+        """Sets up the player to play a new game. The possibilities are kept 
+        as an array of positions in the solution list.
+        """
+        self.game = game
+        self.possibilities = VectorScoring.np.arange(len(game.index.solnIds))
+
+    def playWord(self):
+        """Plays the guess the selector picks. The first guess is always the 
+        same, so it's only worked out once.
+        """
+        index = self.game.index
+        score = Trace.NO_SCORE
+        if len(self.possibilities) <= 2:
+            self.guessId = index.solnIds[self.possibilities[0]]
+        elif len(self.game.rounds) == 0:
+            opening = self.openingChoices.get(
+                index, lambda: self.selector.choose(self.possibilities))
+            self.guessId, score = opening
+        else:
+            self.guessId, score = self.selector.choose(self.possibilities)
+        self.choice = index.wordOf(self.guessId)
+        if Trace.enabled:
+            # The score is how many possibilities the guess should leave.
+            Trace.record(Trace.GUESS, self, self.choice,
+                         count=len(self.possibilities), score=score)
+        return self.choice
+
+    def processFeedback(self, feedback):
+        """Keeps only the possibilities that would have given exactly this 
+        feedback, straight from the guess's row of the table.
+        """
+        code = Feedback.stringToCode(feedback)
+        if Trace.enabled:
+            Trace.record(Trace.FEEDBACK, self, self.choice, code,
+                         count=len(self.possibilities))
+        if code == Feedback.allGreen(len(feedback)):
+            return
+        row = self.selector.table[self.guessId]
+        self.possibilities = self.possibilities[
+            row[self.possibilities] == code]
+        if len(self.possibilities) == 0:
+            raise NoSolutionError("AutoPlayer_MkVI says there's no solution.")
+
+    def __str__(self):
+        return "AutoPlayer (Mark VI)"
+
+PLAYER_MODELS = {
+    1: AutoPlayer_MkI,
+    2: AutoPlayer_MkII,
+    3: AutoPlayer_MkIII,
+    4: AutoPlayer_MkIV,
+    5: AutoPlayer_MkV,
+    6: AutoPlayer_MkVI,
+}
+"""The AutoPlayer generations by their Mark number."""
         
 
-def wordleGameLoop(player, game):
+def wordleGameLoop(player, game, moveTimes=None):
     """ A Generic game loop that takes a player and game object and runs an 
     entire game of Wordle. It returns a score from 6 to 0, where 6 is a game 
     they won on the first try, and 0 is a game they didn't win. 
+
+    If moveTimes is a list, the time each of the player's moves took (choosing
+    a word and then taking in its feedback, but not the game's own work) is 
+    appended to it, in seconds. Every host plays through here, timed or not, 
+    so that the trace always gets its game boundaries. 
     """
-    while not game.isOver():
-        feedback = None
-        while feedback == None:
-            feedback = game.tryRound(player.playWord(), player)
-        player.processFeedback(feedback)
-    return 7-len(game.rounds) if game.isWon() else 0
+    if Trace.enabled:
+        Trace.record(Trace.GAME_START, player, game.solution)
+    score = 0
+    try:
+        while not game.isOver():
+            elapsed = 0.0
+            feedback = None
+            while feedback == None:
+                start = time.perf_counter()
+                word = player.playWord()
+                elapsed += time.perf_counter() - start
+                feedback = game.tryRound(word, player)
+            start = time.perf_counter()
+            player.processFeedback(feedback)
+            if moveTimes is not None:
+                moveTimes.append(elapsed + time.perf_counter() - start)
+        score = 7-len(game.rounds) if game.isWon() else 0
+    finally:
+        # A player that gives up (or breaks) still ends its game in the trace.
+        if Trace.enabled:
+            Trace.record(Trace.GAME_END, player, game.solution, score=score)
+    return score
 
 def playWordle():
     """ Runs a game for a human player. Mostly just for funsies/testing that the
     game logic works :) 
     """
     # Instantiation
-    loggingEnabled = True   # Humans need logging
-    current = Game()
+    # Humans need logging
+    current = Game(config=DEFAULT_CONFIG._replace(logging=True))
     player = HumanPlayer(current)
     print("Let's Play Wordle!")
     if wordleGameLoop(player, current):
@@ -519,43 +712,53 @@ def playWordle():
     else:
         print("You lost... :(  The word was " + current.solution + "!")
 
-def runSimulation(iterations, models):
-    """ For all AutoPlayer generations in the file, it runs them through a 
-    number of games specified as the iterations argument, tracking their 
-    performance and outputting statistics to the console at the end. 
+def printResults(scores):
+    """Prints the statistics for one solver's list of scores. 
     """
-    game = Game()
+    iterations = len(scores)
+    total_wins = sum(1 for score in scores if score > 0)
+    best_score = max(scores, default=0)
+    avg_of_wins = round(sum(scores) / total_wins,2) if total_wins > 0 else 0.0
+    avg_score = sum(scores) / float(iterations)
+    winrate = round(float(total_wins)/float(iterations)*100, 2)
+    print("         Total Wins: " + str(total_wins))
+    print("       Win Rate (%): " + str(winrate) + "%")
+    print("         Best Score: " + str(best_score))
+    print("         Avg. Score: " + str(round(avg_score,2)))
+    print(" Avg. Score of Wins: " + str(avg_of_wins))
+    print()
+
+def printSimulationHeader(iterations):
     print()
     print(" WORDLE SOLVER SIMULATION")
     print(" ------------------------")
     print()
     print(" Each solver plays " + str(iterations) + " games with randomly chose"
          + "n words from the list of possible Worlde solutions (of which there "
-         + "are " + str(len(game.soln_words)) + ")")
+         + "are " + str(len(Game.soln_words)) + ")")
     print(" Scores range from 0 to 6, based on how many guesses they had remain"
          + "ing before they made their winning guess. IE: 6 means they got it o"
          + "n the first try, 1 means they got it on the last guess, and 0 means"
          + " they didn't get it.)")
     print()
 
+def runSimulation(iterations, models, config=DEFAULT_CONFIG):
+    """ For all AutoPlayer generations in the file, it runs them through a 
+    number of games specified as the iterations argument, tracking their 
+    performance and outputting statistics to the console at the end. 
+    """
+    game = Game(config=config)
+    printSimulationHeader(iterations)
+
     # Progress bars... those are a cool trick!
-    progressChunk = int(iterations/10)
+    progressChunk = max(1, int(iterations/10))
     
     for i in models:
-        if i == 1:
-            player = AutoPlayer_MkI(game) 
-        elif i == 2:
-            player = AutoPlayer_MkII(game)
-        elif i == 3:
-            player = AutoPlayer_MkIII(game)
-        elif i == 4:
-            player = AutoPlayer_MkIV(game)
+        player = PLAYER_MODELS[i](game)
         print(" Testing the Mk. " + str(i) + ": ")
         print(" ---------------------------")
         print(" PROG.: ", end="", flush=True)
-        total_wins = 0
-        best_score = 0
-        avg_score = 0.0
+        scores = []
         for j in range(iterations):
 
             #Progress update:
@@ -563,27 +766,65 @@ def runSimulation(iterations, models):
                 print(" X", end="", flush=True)
 
 
-            score = wordleGameLoop(player, game)
+            scores.append(wordleGameLoop(player, game))
             game.reset()
             player.reset(game)
-            total_wins += 1 if score > 0 else 0
-            if score > 0:
-                best_score = score if score > best_score else best_score
-            avg_score += float(score)
-        print()
-        avg_of_wins = round(avg_score / total_wins,2) if total_wins > 0 else 0.0
-        avg_score /= float(iterations)
-        winrate = round(float(total_wins)/float(iterations)*100, 2)
-        print("         Total Wins: " + str(total_wins))
-        print("       Win Rate (%): " + str(winrate) + "%")
-        print("         Best Score: " + str(best_score))
-        print("         Avg. Score: " + str(round(avg_score,2)))
-        print(" Avg. Score of Wins: " + str(avg_of_wins))
         print()
+        printResults(scores)
+
+def playGames(model, games, config=DEFAULT_CONFIG, seed=None):
+    """Plays a number of games with one AutoPlayer generation and returns the 
+    list of scores. The games are played on a Game, player and random number 
+    generator of their own, and everything they share with other calls (the 
+    word lists, index and config) is read-only, so any number of these can run
+    at once on different threads. 
+    """
+    game = Game(config=config, rng=random.Random(seed))
+    player = PLAYER_MODELS[model](game)
+    scores = []
+    for j in range(games):
+        scores.append(wordleGameLoop(player, game))
+        game.reset()
+        player.reset(game)
+    return scores
+
+def runThreadedSimulation(iterations, models, threads=None, 
+                          config=DEFAULT_CONFIG, seed=None):
+    """ The same as runSimulation(), but each solver's games are split into 
+    batches that are played concurrently on a pool of threads. On a regular 
+    build of Python the GIL keeps this to one core, but on a free-threaded build
+    the batches really do run in parallel, without the cost of starting and 
+    feeding worker processes. 
+
+    With a seed, each batch gets its own seeded random number generator, so the
+    results are repeatable no matter how the threads get scheduled. 
+    """
+    threads = threads if threads else os.cpu_count()
+    printSimulationHeader(iterations)
+    batchSize = max(1, -(-iterations // (threads * 4)))    # Ceiling division
+    with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as pool:
+        batches = {}
+        for i in models:
+            batches[i] = []
+            for start in range(0, iterations, batchSize):
+                batchSeed = None if seed is None else \
+                    seed * 1000003 + i * 10007 + start
+                batches[i].append(pool.submit(
+                    playGames, i, min(batchSize, iterations - start), config, 
+                    batchSeed))
+        for i in models:
+            print(" Testing the Mk. " + str(i) + ": ")
+            print(" ---------------------------")
+            scores = []
+            for batch in batches[i]:
+                scores += batch.result()
+            printResults(scores)
 
 
          
 
-#player = AutoPlayer_MkIV()
-runSimulation(100, [1,2,3,4])
-#playWordle()
+if __name__ == "__main__":
+    #player = AutoPlayer_MkIV()
+    runSimulation(100, [1,2,3,4,5,6] if VectorScoring.available else [1,2,3,4])
+    #runThreadedSimulation(100, [1,2,3,4,5], seed=0)
+    #playWordle()